@@ -1,8 +1,21 @@
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Tuple, Optional, List
 from datetime import datetime, timedelta
+import numpy as np
 
-@dataclass
+class DeliveryStatus(IntEnum):
+    """Integer codes for Delivery.status, used by the array mirrors."""
+    PENDING = 0
+    COMPLETED = 1
+    FAILED = 2
+    IN_PROGRESS = 3
+
+STATUS_CODES = {status.name.lower(): status for status in DeliveryStatus}
+# Marker color per status, indexed by DeliveryStatus
+STATUS_COLOR_NAMES = ('gray', 'green', 'red', 'blue')
+
+@dataclass(slots=True)
 class Delivery:
     id: str
     position: Tuple[float, float]
@@ -12,9 +25,21 @@ class Delivery:
     time_window_end: datetime
     assigned_drone: Optional[str] = None
     status: str = "pending"  # pending, in_progress, completed, failed
+    # Time window as epoch seconds, for cheap float compares in hot loops
+    _t0: float = field(init=False, repr=False, compare=False)
+    _t1: float = field(init=False, repr=False, compare=False)
+    # Higher priority first, then earlier deadline; compared as a plain tuple
+    sort_key: Tuple[int, float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._t0 = self.time_window_start.timestamp()
+        self._t1 = self.time_window_end.timestamp()
+        self.sort_key = (-self.priority, self._t1)
     
-    def is_within_time_window(self, current_time: datetime) -> bool:
-        """Check if current time is within delivery time window."""
+    def is_within_time_window(self, current_time) -> bool:
+        """Check if current time (datetime or epoch seconds) is within delivery time window."""
+        if isinstance(current_time, (int, float)):
+            return self._t0 <= current_time <= self._t1
         return self.time_window_start <= current_time <= self.time_window_end
     
     def time_until_deadline(self, current_time: datetime) -> timedelta:
@@ -57,6 +82,109 @@ class Delivery:
     
     def __lt__(self, other: 'Delivery') -> bool:
         """Compare deliveries based on priority and deadline."""
-        if self.priority != other.priority:
-            return self.priority > other.priority  # Higher priority first
-        return self.time_window_end < other.time_window_end  # Earlier deadline first 
\ No newline at end of file
+        return self.sort_key < other.sort_key
+
+class DeliveryArrays:
+    """Structure-of-arrays mirror of a delivery list for vectorized math.
+
+    Rows follow insertion order; storage grows by doubling so appends are
+    amortized O(1). Only the first ``len(self)`` rows are valid.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        capacity = max(capacity, 1)
+        self.ids: List[str] = []
+        self._positions = np.empty((capacity, 2), dtype=np.float64)
+        self._weights = np.empty(capacity, dtype=np.float64)
+        self._priorities = np.empty(capacity, dtype=np.int64)
+        self._starts = np.empty(capacity, dtype=np.float64)
+        self._ends = np.empty(capacity, dtype=np.float64)
+        self._statuses = np.empty(capacity, dtype=np.int8)
+    
+    @classmethod
+    def from_deliveries(cls, deliveries: List[Delivery]) -> 'DeliveryArrays':
+        """Build arrays for the given deliveries."""
+        arrays = cls(len(deliveries))
+        arrays.extend(deliveries)
+        return arrays
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def _grow(self, min_capacity: int = 0):
+        capacity = max(2 * len(self._weights), min_capacity)
+        for name in ('_positions', '_weights', '_priorities', '_starts', '_ends', '_statuses'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def append(self, delivery: Delivery):
+        """Add a delivery as the last row."""
+        n = len(self.ids)
+        if n == len(self._weights):
+            self._grow()
+        self.ids.append(delivery.id)
+        self._positions[n] = delivery.position
+        self._weights[n] = delivery.weight
+        self._priorities[n] = delivery.priority
+        self._starts[n] = delivery._t0
+        self._ends[n] = delivery._t1
+        self._statuses[n] = STATUS_CODES.get(delivery.status, 0)
+    
+    def extend(self, deliveries: List[Delivery]):
+        """Add several deliveries, growing storage at most once."""
+        if not deliveries:
+            return
+        n = len(self.ids)
+        end = n + len(deliveries)
+        if end > len(self._weights):
+            self._grow(end)
+        self.ids.extend(delivery.id for delivery in deliveries)
+        self._positions[n:end] = [delivery.position for delivery in deliveries]
+        self._weights[n:end] = [delivery.weight for delivery in deliveries]
+        self._priorities[n:end] = [delivery.priority for delivery in deliveries]
+        self._starts[n:end] = [delivery._t0 for delivery in deliveries]
+        self._ends[n:end] = [delivery._t1 for delivery in deliveries]
+        self._statuses[n:end] = [STATUS_CODES.get(delivery.status, 0) for delivery in deliveries]
+    
+    def matches(self, deliveries: List[Delivery]) -> bool:
+        """Check whether the rows line up with the given deliveries."""
+        return len(deliveries) == len(self.ids) and all(d.id == i for d, i in zip(deliveries, self.ids))
+    
+    def refresh_statuses(self, deliveries: List[Delivery]):
+        """Re-read the status column, the only one that changes after creation."""
+        self._statuses[:len(deliveries)] = [STATUS_CODES.get(d.status, 0) for d in deliveries]
+    
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions[:len(self.ids)]
+    
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights[:len(self.ids)]
+    
+    @property
+    def priorities(self) -> np.ndarray:
+        return self._priorities[:len(self.ids)]
+    
+    @property
+    def starts(self) -> np.ndarray:
+        """Time window starts as epoch seconds."""
+        return self._starts[:len(self.ids)]
+    
+    @property
+    def ends(self) -> np.ndarray:
+        """Time window ends as epoch seconds."""
+        return self._ends[:len(self.ids)]
+    
+    @property
+    def statuses(self) -> np.ndarray:
+        """Status codes, see STATUS_CODES."""
+        return self._statuses[:len(self.ids)]
+    
+    def window_mask(self, current_time) -> np.ndarray:
+        """Boolean mask of deliveries whose time window contains current_time."""
+        if isinstance(current_time, datetime):
+            current_time = current_time.timestamp()
+        return (self.starts <= current_time) & (current_time <= self.ends)
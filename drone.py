@@ -1,8 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, List
+import math
 import numpy as np
 
-@dataclass
+def euclid(ax: float, ay: float, bx: float, by: float) -> float:
+    """Euclidean distance between (ax, ay) and (bx, by)."""
+    return math.hypot(bx - ax, by - ay)
+
+def route_length(route) -> float:
+    """Total length of a polyline given as a list of points or an (N, 2) array."""
+    points = np.asarray(route, dtype=np.float64)
+    if len(points) < 2:
+        return 0.0
+    steps = np.diff(points, axis=0)
+    return float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+
+def _energy(distance: float, speed: float) -> float:
+    """Battery consumed flying the given distance at the given speed."""
+    return distance / speed
+
+def distance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise Euclidean distances between (N, 2) and (M, 2) point arrays."""
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 2)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 2)
+    return np.hypot(a[:, None, 0] - b[None, :, 0], a[:, None, 1] - b[None, :, 1])
+
+@dataclass(slots=True)
 class Drone:
     id: str
     max_weight: float
@@ -13,6 +36,10 @@ class Drone:
     current_battery: float = None
     current_weight: float = 0.0
     route: List[Tuple[float, float]] = None
+    # Packed (N, 2) copy of route for vectorized math, filled in by route_array()
+    _route_buf: np.ndarray = field(init=False, repr=False, compare=False)
+    _route_view: np.ndarray = field(init=False, repr=False, compare=False)
+    _route_src: list = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.current_position is None:
@@ -21,6 +48,9 @@ class Drone:
             self.current_battery = self.battery_capacity
         if self.route is None:
             self.route = [self.start_position]
+        self._route_buf = np.empty((0, 2), dtype=np.float64)
+        self._route_view = self._route_buf
+        self._route_src = None
     
     def can_carry(self, weight: float) -> bool:
         """Check if drone can carry additional weight."""
@@ -28,15 +58,22 @@ class Drone:
     
     def has_sufficient_battery(self, distance: float) -> bool:
         """Check if drone has enough battery for given distance."""
-        energy_needed = distance / self.speed
-        return self.current_battery >= energy_needed
+        return self.current_battery >= _energy(distance, self.speed)
     
     def update_position(self, new_position: Tuple[float, float], distance: float):
         """Update drone position and battery level."""
         self.current_position = new_position
-        self.current_battery -= distance / self.speed
+        self.current_battery -= _energy(distance, self.speed)
         self.route.append(new_position)
     
+    def update_route(self, points: List[Tuple[float, float]], distance: float):
+        """Fly through several points at once; distance is the total length flown."""
+        if not points:
+            return
+        self.current_position = points[-1]
+        self.current_battery -= _energy(distance, self.speed)
+        self.route.extend(points)
+    
     def reset(self):
         """Reset drone to initial state."""
         self.current_position = self.start_position
@@ -44,6 +81,32 @@ class Drone:
         self.current_weight = 0.0
         self.route = [self.start_position]
     
+    def route_array(self) -> np.ndarray:
+        """The route as an (N, 2) float array.
+        
+        The backing buffer grows by doubling and only points appended since
+        the last call are converted; an unchanged route returns the same
+        array object. A replaced route list gets a new buffer, so arrays
+        returned earlier never change underneath their holders.
+        """
+        route = self.route
+        view = self._route_view
+        if route is not self._route_src or len(route) < len(view):
+            # Replaced or shortened route: start over in a fresh buffer
+            self._route_src = route
+            self._route_buf = np.empty((max(len(route), 8), 2), dtype=np.float64)
+            view = self._route_buf[:0]
+        n, m = len(view), len(route)
+        if m > n:
+            if m > len(self._route_buf):
+                buf = np.empty((max(2 * len(self._route_buf), m), 2), dtype=np.float64)
+                buf[:n] = view
+                self._route_buf = buf
+            self._route_buf[n:m] = route[n:m]
+            view = self._route_buf[:m]
+        self._route_view = view
+        return view
+    
     def get_remaining_battery_percentage(self) -> float:
         """Get remaining battery as percentage."""
         return (self.current_battery / self.battery_capacity) * 100
@@ -65,4 +128,114 @@ class Drone:
     @classmethod
     def from_dict(cls, data: dict) -> 'Drone':
         """Create drone instance from dictionary."""
-        return cls(**data) 
\ No newline at end of file
+        return cls(**data) 
+
+class DroneArrays:
+    """Structure-of-arrays mirror of a drone fleet for vectorized math.
+
+    Rows follow insertion order; storage grows by doubling so appends are
+    amortized O(1). Only the first ``len(self)`` rows are valid.
+    """
+    
+    def __init__(self, capacity: int = 8):
+        capacity = max(capacity, 1)
+        self.ids: List[str] = []
+        self._positions = np.empty((capacity, 2), dtype=np.float64)
+        self._batteries = np.empty(capacity, dtype=np.float64)
+        self._max_weights = np.empty(capacity, dtype=np.float64)
+        self._speeds = np.empty(capacity, dtype=np.float64)
+        self._current_weights = np.empty(capacity, dtype=np.float64)
+        self._capacities = np.empty(capacity, dtype=np.float64)
+    
+    @classmethod
+    def from_drones(cls, drones: List[Drone]) -> 'DroneArrays':
+        """Build arrays for the given drones."""
+        arrays = cls(len(drones))
+        arrays.extend(drones)
+        return arrays
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def _grow(self, min_capacity: int = 0):
+        capacity = max(2 * len(self._batteries), min_capacity)
+        for name in ('_positions', '_batteries', '_max_weights', '_speeds', '_current_weights',
+                     '_capacities'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def _write(self, i: int, drone: Drone):
+        self._positions[i] = drone.current_position
+        self._batteries[i] = drone.current_battery
+        self._max_weights[i] = drone.max_weight
+        self._speeds[i] = drone.speed
+        self._current_weights[i] = drone.current_weight
+        self._capacities[i] = drone.battery_capacity
+    
+    def append(self, drone: Drone):
+        """Add a drone as the last row."""
+        n = len(self.ids)
+        if n == len(self._batteries):
+            self._grow()
+        self.ids.append(drone.id)
+        self._write(n, drone)
+    
+    def extend(self, drones: List[Drone]):
+        """Add several drones, growing storage at most once."""
+        if not drones:
+            return
+        n = len(self.ids)
+        end = n + len(drones)
+        if end > len(self._batteries):
+            self._grow(end)
+        self.ids.extend(drone.id for drone in drones)
+        self._positions[n:end] = [drone.current_position for drone in drones]
+        self._batteries[n:end] = [drone.current_battery for drone in drones]
+        self._max_weights[n:end] = [drone.max_weight for drone in drones]
+        self._speeds[n:end] = [drone.speed for drone in drones]
+        self._current_weights[n:end] = [drone.current_weight for drone in drones]
+        self._capacities[n:end] = [drone.battery_capacity for drone in drones]
+    
+    def matches(self, drones: List[Drone]) -> bool:
+        """Check whether the rows line up with the given drones."""
+        return len(drones) == len(self.ids) and all(d.id == i for d, i in zip(drones, self.ids))
+    
+    def refresh(self, drones: List[Drone]):
+        """Re-read every row from the (possibly mutated) drone objects."""
+        for i, drone in enumerate(drones):
+            self._write(i, drone)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions[:len(self.ids)]
+    
+    @property
+    def batteries(self) -> np.ndarray:
+        return self._batteries[:len(self.ids)]
+    
+    @property
+    def max_weights(self) -> np.ndarray:
+        return self._max_weights[:len(self.ids)]
+    
+    @property
+    def speeds(self) -> np.ndarray:
+        return self._speeds[:len(self.ids)]
+    
+    @property
+    def current_weights(self) -> np.ndarray:
+        return self._current_weights[:len(self.ids)]
+    
+    @property
+    def battery_percentages(self) -> np.ndarray:
+        """Vectorized get_remaining_battery_percentage."""
+        n = len(self.ids)
+        return self._batteries[:n] / self._capacities[:n] * 100
+    
+    def feasibility(self, weight: float, distances: np.ndarray = None) -> np.ndarray:
+        """Vectorized can_carry (and has_sufficient_battery when distances are given) over all rows."""
+        mask = self.current_weights + weight <= self.max_weights
+        if distances is not None:
+            mask &= self.batteries >= _energy(np.asarray(distances, dtype=np.float64), self.speeds)
+        return mask
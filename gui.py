@@ -1,25 +1,45 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QTabWidget, QPushButton, QLabel, 
-                            QLineEdit, QSpinBox, QDoubleSpinBox, QTableWidget, 
-                            QTableWidgetItem, QMessageBox, QGroupBox, QFormLayout,
-                            QCheckBox, QDialog, QDialogButtonBox, QRadioButton,
-                            QButtonGroup)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF
-import matplotlib.pyplot as plt
+                            QHBoxLayout, QPushButton, QLabel, 
+                            QLineEdit, QSpinBox, QDoubleSpinBox, QMessageBox, QGroupBox, QFormLayout,
+                            QDialog, QDialogButtonBox, QRadioButton,
+                            QButtonGroup, QTableView, QHeaderView, QProgressDialog)
+from PyQt5.QtCore import (Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+                          QAbstractTableModel, QModelIndex)
+import matplotlib
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch, PathPatch
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.colors import to_rgba_array
 import numpy as np
 from datetime import datetime, timedelta
 import concurrent.futures
+import copy
+import multiprocessing
+from contextlib import contextmanager
+from functools import lru_cache
 
 from drone import Drone
-from delivery import Delivery
+from delivery import Delivery, DeliveryStatus, STATUS_COLOR_NAMES
 from zone import NoFlyZone
-from routing import AStarRouter
-from optimizer import DeliveryOptimizer, GeneticOptimizer, DataManager
-from main import DroneDeliverySystem
+from optimizer import Assignment
+from main import DroneDeliverySystem, optimize_worker
+
+# (status name, marker color) and RGBA lookup table, both indexed by DeliveryStatus
+STATUS_COLORS = [(status.name.lower(), STATUS_COLOR_NAMES[status]) for status in DeliveryStatus]
+STATUS_RGBA = to_rgba_array(STATUS_COLOR_NAMES).astype(np.float32)
+
+@lru_cache(maxsize=16)
+def _rainbow(n):
+    """n evenly spaced rainbow colors as a read-only (n, 4) RGBA array."""
+    colors = matplotlib.colormaps['rainbow'](np.linspace(0, 1, n))
+    colors.setflags(write=False)
+    return colors
+
+# Artist groups that update_plot can refresh independently
+DIRTY_ALL = frozenset({'drones', 'deliveries', 'zones', 'routes'})
 
 class MapCanvas(FigureCanvas):
     def __init__(self, parent=None, width=8, height=6, dpi=100):
@@ -29,70 +49,430 @@ class MapCanvas(FigureCanvas):
         self.setParent(parent)
         
         # Initialize empty data
-        self.drones = []
-        self.deliveries = []
         self.no_fly_zones = []
         self.routes = {}
         
-    def update_plot(self, drones, deliveries, no_fly_zones, routes=None):
-        self.axes.clear()
-        self.drones = drones
-        self.deliveries = deliveries
+        self.axes.set_xlim(0, 100)
+        self.axes.set_ylim(0, 100)
+        self.axes.set_title("Drone Delivery Fleet Visualization")
+        self.axes.set_xlabel("X Coordinate")
+        self.axes.set_ylabel("Y Coordinate")
+        
+        # Persistent artists - update_plot only swaps their data.
+        # Zones are part of the static background; everything else is
+        # animated and blitted on top of it.
+        self.zone_collection = PatchCollection([], facecolor='red', alpha=0.3)
+        self.axes.add_collection(self.zone_collection)
+        self.route_collection = LineCollection([], linewidths=2, alpha=0.7,
+                                               linestyle='-', animated=True)
+        self.axes.add_collection(self.route_collection)
+        self.delivery_scatter = self.axes.scatter([], [], marker='o', s=100, animated=True)
+        self.drone_scatter = self.axes.scatter([], [], marker='^', s=150, animated=True)
+        self.delivery_texts = []
+        self.drone_texts = []
+        self._text_values = {}  # Text artist -> value currently shown
+        self.legend = None
+        self._legend_parts = {'zones': [], 'deliveries': [], 'drones': []}
+        self._color_ids = None
+        self._color_map = {}
+        self._route_arrays = {}
+        self._route_key = None
+        self._zone_paths = None
+        self._background = None
+        self._render_pending = False
+        self._needs_full_draw = False
+        
+        # Leave room on the right for the legend; layout is done once here
+        self.fig.tight_layout(rect=(0, 0, 0.75, 1))
+        self.mpl_connect('draw_event', self._on_draw)
+        
+    def _on_draw(self, event):
+        """Capture the static background after a full draw."""
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+        
+    def _animated_artists(self):
+        artists = [self.route_collection, self.delivery_scatter, self.drone_scatter]
+        artists.extend(t for t in self.delivery_texts + self.drone_texts if t.get_visible())
+        if self.legend is not None:
+            artists.append(self.legend)
+        return artists
+        
+    def _draw_animated(self):
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+            
+    def _get_text(self, pool, i, fontsize):
+        """Return the i-th label artist of a pool, creating it on demand."""
+        while len(pool) <= i:
+            pool.append(self.axes.text(0, 0, '', ha='center', fontsize=fontsize, animated=True))
+        text = pool[i]
+        text.set_visible(True)
+        return text
+        
+    def _set_label(self, text, value, fmt):
+        """Format and set the label only when the shown value changed."""
+        if self._text_values.get(text) != value:
+            self._text_values[text] = value
+            text.set_text(fmt.format(value))
+        
+    def update_plot(self, snapshot, no_fly_zones, routes=None, dirty=None):
+        """Refresh the map from a DroneDeliverySystem.snapshot().
+        
+        dirty limits the work to the given DIRTY_ALL groups.
+        """
+        dirty = DIRTY_ALL if dirty is None else dirty
         self.no_fly_zones = no_fly_zones
         if routes:
             self.routes = routes
             
-        # Plot no-fly zones
-        for zone in no_fly_zones:
-            polygon = plt.Polygon(zone.polygon_coordinates, 
-                                facecolor='red', alpha=0.3,
-                                label='No-Fly Zone')
-            self.axes.add_patch(polygon)
-            
-        # Plot delivery points
-        for delivery in deliveries:
-            color = 'green' if delivery.status == "completed" else \
-                   'red' if delivery.status == "failed" else \
-                   'blue' if delivery.status == "in_progress" else 'gray'
-            
-            self.axes.scatter(delivery.position[0], delivery.position[1],
-                            c=color, marker='o', s=100,
-                            label=f'Delivery {delivery.id}')
-            
-            # Add priority label
-            self.axes.text(delivery.position[0], delivery.position[1] + 0.5,
-                          f'P{delivery.priority}', ha='center')
-            
-        # Plot drones and their routes
-        colors = plt.cm.rainbow(np.linspace(0, 1, len(drones)))
-        for i, drone in enumerate(drones):
-            color = colors[i]
+        # No-fly zones (static background)
+        zones_changed = False
+        if 'zones' in dirty:
+            zone_paths = [zone.path for zone in no_fly_zones]
+            zones_changed = self._zone_paths is None or len(zone_paths) != len(self._zone_paths) or \
+                any(a is not b for a, b in zip(zone_paths, self._zone_paths))
+            if zones_changed:
+                self._zone_paths = zone_paths
+                self.zone_collection.set_paths([PathPatch(path) for path in zone_paths])
+            self._legend_parts['zones'] = [Patch(facecolor='red', alpha=0.3, label='No-Fly Zone')] \
+                if no_fly_zones else []
+                
+        if 'deliveries' in dirty:
+            self._update_deliveries(snapshot)
+        if 'drones' in dirty or 'routes' in dirty:
+            self._update_drones(snapshot)
             
-            # Plot drone's current position
-            self.axes.scatter(drone.current_position[0], drone.current_position[1],
-                            c=[color], marker='^', s=150,
-                            label=f'Drone {drone.id}')
+        # Legend is rebuilt only when its entries change
+        legend_handles = [h for part in ('zones', 'deliveries', 'drones') for h in self._legend_parts[part]]
+        labels = [h.get_label() for h in legend_handles]
+        if self.legend is None or labels != [t.get_text() for t in self.legend.get_texts()]:
+            if self.legend is not None:
+                self.legend.remove()
+                self.legend = None
+            if legend_handles:
+                self.legend = self.axes.legend(handles=legend_handles,
+                                               bbox_to_anchor=(1.05, 1), loc='upper left')
+                self.legend.set_animated(True)
+                
+        self._request_render(full=zones_changed)
+        
+    def _request_render(self, full=False):
+        """Schedule one render on the next event-loop pass; repeated requests coalesce."""
+        self._needs_full_draw |= full
+        if not self._render_pending:
+            self._render_pending = True
+            QTimer.singleShot(0, self._render)
             
-            # Plot drone's route
-            if drone.id in self.routes:
-                route = self.routes[drone.id]
-                route_x = [p[0] for p in route]
-                route_y = [p[1] for p in route]
-                self.axes.plot(route_x, route_y, c=color, alpha=0.7, linestyle='-', linewidth=2)
+    def _render(self):
+        self._render_pending = False
+        if self._needs_full_draw or self._background is None:
+            # Static content changed: full redraw, background is recaptured in _on_draw
+            self._needs_full_draw = False
+            self.draw()
+        else:
+            self.restore_region(self._background)
+            self._draw_animated()
+            self.blit(self.fig.bbox)
             
-            # Add battery level
-            battery_text = f'Battery: {drone.get_remaining_battery_percentage():.1f}%'
-            self.axes.text(drone.current_position[0], drone.current_position[1] - 0.5,
-                          battery_text, ha='center', fontsize=8)
+    def _update_deliveries(self, snapshot):
+        """Delivery markers, priority labels and their legend entries."""
+        handles = []
+        positions = snapshot['delivery_pos']
+        status = snapshot['delivery_status']
+        self.delivery_scatter.set_offsets(positions)
+        self.delivery_scatter.set_facecolor(STATUS_RGBA[status])
+        present = np.bincount(status, minlength=len(STATUS_COLORS)) > 0
+        for k, (name, color) in enumerate(STATUS_COLORS):
+            if present[k]:
+                handles.append(Line2D([], [], color=color, marker='o', markersize=10,
+                                      linestyle='', label=f'Delivery ({name})'))
+                
+        # Priority labels
+        for i, (priority, x, y) in enumerate(zip(snapshot['delivery_priority'].tolist(),
+                                                 positions[:, 0].tolist(), positions[:, 1].tolist())):
+            text = self._get_text(self.delivery_texts, i, 10)
+            text.set_position((x, y + 0.5))
+            self._set_label(text, priority, 'P{}')
+        for text in self.delivery_texts[len(positions):]:
+            text.set_visible(False)
+        self._legend_parts['deliveries'] = handles
+        
+    def _route_array(self, drone_id, route):
+        """Per-drone route vertices, converted again only when the route grew or was replaced."""
+        cached = self._route_arrays.get(drone_id)
+        if cached is None or cached[0] is not route or cached[1] != len(route):
+            cached = (route, len(route), np.asarray(route, dtype=np.float64))
+            self._route_arrays[drone_id] = cached
+        return cached[2]
+        
+    def _update_drones(self, snapshot):
+        """Drone markers, battery labels, routes and their legend entries."""
+        handles = []
+        # Colors are reassigned only when the set of drones changes
+        ids = tuple(snapshot['drone_ids'])
+        if ids != self._color_ids:
+            self._color_ids = ids
+            self._color_map = dict(zip(ids, _rainbow(len(ids))))
+        positions = snapshot['drone_pos']
+        self.drone_scatter.set_offsets(positions)
+        self.drone_scatter.set_facecolor(_rainbow(len(ids)))
+        # Battery labels are relabelled only on a visible (0.1%) change
+        batteries = np.round(snapshot['drone_battery_pct'], 1).tolist()
+        segments = []
+        segment_colors = []
+        for i, (drone_id, x, y) in enumerate(zip(ids, positions[:, 0].tolist(), positions[:, 1].tolist())):
+            color = self._color_map[drone_id]
+            handles.append(Line2D([], [], color=color, marker='^', markersize=10,
+                                  linestyle='', label=f'Drone {drone_id}'))
             
-        self.axes.set_xlim(0, 100)
-        self.axes.set_ylim(0, 100)
-        self.axes.set_title("Drone Delivery Fleet Visualization")
-        self.axes.set_xlabel("X Coordinate")
-        self.axes.set_ylabel("Y Coordinate")
-        self.axes.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        self.fig.tight_layout()
-        self.draw()
+            if drone_id in self.routes:
+                segments.append(self._route_array(drone_id, self.routes[drone_id]))
+                segment_colors.append(color)
+                
+            text = self._get_text(self.drone_texts, i, 8)
+            text.set_position((x, y - 0.5))
+            self._set_label(text, batteries[i], 'Battery: {:.1f}%')
+        # Only touch the collection when some route actually changed
+        key = (ids, [id(segment) for segment in segments])
+        if key != self._route_key:
+            self._route_key = key
+            self.route_collection.set_segments(segments)
+            self.route_collection.set_color(segment_colors)
+            for drone_id in self._route_arrays.keys() - set(ids):
+                del self._route_arrays[drone_id]
+        for text in self.drone_texts[len(ids):]:
+            text.set_visible(False)
+        self._legend_parts['drones'] = handles
+
+# Add-dialog fields: (key, label, widget type, value range)
+_FIELD_SPECS = {
+    'drone': [
+        ('id', "ID:", QLineEdit, None),
+        ('max_weight', "Max Weight:", QDoubleSpinBox, (0, 100)),
+        ('battery', "Battery Capacity:", QDoubleSpinBox, (0, 100000)),
+        ('speed', "Speed:", QDoubleSpinBox, (0, 100)),
+        ('start_x', "Start X:", QDoubleSpinBox, (0, 100)),
+        ('start_y', "Start Y:", QDoubleSpinBox, (0, 100)),
+    ],
+    'delivery': [
+        ('id', "ID:", QLineEdit, None),
+        ('pos_x', "Position X:", QDoubleSpinBox, (0, 100)),
+        ('pos_y', "Position Y:", QDoubleSpinBox, (0, 100)),
+        ('weight', "Weight:", QDoubleSpinBox, (0, 100)),
+        ('priority', "Priority:", QSpinBox, (1, 5)),
+    ],
+}
+
+# Status summary emoji; unknown drone statuses get ⚠️, unknown delivery statuses 🔄
+_DRONE_STATUS_EMOJI = {"available": "✅", "busy": "🔄"}
+_DELIVERY_STATUS_EMOJI = {"pending": "⏳", "completed": "✅", "failed": "❌"}
+
+# Sample data; time windows are minute offsets from the load time
+_SAMPLE_DRONES = np.array([
+    ("1", 4.0, 12000, 8.0, 10, 10),
+    ("2", 3.5, 10000, 10.0, 20, 30),
+    ("3", 5.0, 15000, 7.0, 50, 50),
+    ("4", 2.0, 8000, 12.0, 80, 20),
+    ("5", 6.0, 20000, 5.0, 40, 70),
+], dtype=[('id', 'U4'), ('max_weight', 'f8'), ('battery', 'f8'), ('speed', 'f8'),
+          ('x', 'f8'), ('y', 'f8')])
+
+_SAMPLE_DELIVERIES = np.array([
+    ("1", 15, 25, 1.5, 3, 0, 60),
+    ("2", 30, 40, 2.0, 5, 0, 30),
+    ("3", 70, 80, 3.0, 2, 20, 80),
+    ("4", 90, 10, 1.0, 4, 10, 40),
+    ("5", 45, 60, 4.0, 1, 30, 90),
+    ("6", 25, 15, 2.5, 3, 0, 50),
+    ("7", 60, 30, 1.0, 5, 5, 25),
+    ("8", 85, 90, 3.5, 2, 40, 100),
+    ("9", 10, 80, 2.0, 4, 15, 45),
+    ("10", 95, 50, 1.5, 3, 0, 60),
+    ("11", 55, 20, 0.5, 5, 0, 20),
+    ("12", 35, 75, 2.0, 1, 50, 120),
+    ("13", 75, 40, 3.0, 3, 10, 50),
+    ("14", 20, 90, 1.5, 4, 30, 70),
+    ("15", 65, 65, 4.5, 2, 25, 75),
+    ("16", 40, 10, 2.0, 5, 0, 30),
+    ("17", 5, 50, 1.0, 3, 15, 55),
+    ("18", 50, 85, 3.0, 1, 60, 100),
+    ("19", 80, 70, 2.5, 4, 20, 60),
+    ("20", 30, 55, 1.5, 2, 40, 80),
+], dtype=[('id', 'U4'), ('x', 'f8'), ('y', 'f8'), ('weight', 'f8'), ('priority', 'i8'),
+          ('t0', 'i8'), ('t1', 'i8')])
+
+_SAMPLE_ZONES = (
+    ("1", [(40, 30), (60, 30), (60, 50), (40, 50)], (0, 120)),
+    ("2", [(70, 10), (90, 10), (90, 30), (70, 30)], (30, 90)),
+    ("3", [(10, 60), (30, 60), (30, 80), (10, 80)], (0, 60)),
+)
+
+def _make_form(dialog, spec):
+    """Create a form layout with OK/Cancel buttons from a field spec; returns (layout, fields)."""
+    layout = QFormLayout()
+    fields = {}
+    for key, label, widget_type, value_range in spec:
+        widget = widget_type()
+        if value_range is not None:
+            widget.setRange(*value_range)
+        layout.addRow(label, widget)
+        fields[key] = widget
+    buttons = QDialogButtonBox(
+        QDialogButtonBox.Ok | QDialogButtonBox.Cancel,
+        Qt.Horizontal, dialog)
+    buttons.accepted.connect(dialog.accept)
+    buttons.rejected.connect(dialog.reject)
+    layout.addRow(buttons)
+    return layout, fields
+
+def _parse_coords(text):
+    """Parse "x1,y1;x2,y2;..." into an (N, 2) float array; raises ValueError."""
+    values = np.array(text.replace(';', ',').split(','), dtype=np.float64)
+    if values.size % 2:
+        raise ValueError(f"odd number of values ({values.size})")
+    return values.reshape(-1, 2)
+
+class DroneStatsModel(QAbstractTableModel):
+    """Table model over per-drone report columns; one signal per update."""
+    HEADERS = ["Drone ID", "Battery", "Distance", "Deliveries"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = []
+        self.battery = np.empty(0)
+        self.distance = np.empty(0)
+        self.deliveries = np.empty(0, dtype=np.int64)
+        self._cells = []  # formatted rows, rebuilt per report instead of per paint
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cells[index.row()][index.column()]
+    
+    def _format_cells(self):
+        self._cells = [(drone_id, f"{battery:.1f}%", f"{distance:.1f}", str(count))
+                       for drone_id, battery, distance, count in
+                       zip(self.ids, self.battery.tolist(), self.distance.tolist(),
+                           self.deliveries.tolist())]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+    
+    def set_statistics(self, drone_statistics):
+        """Replace the columns from a report's drone_statistics dict."""
+        ids = list(drone_statistics)
+        stats = list(drone_statistics.values())
+        battery = np.array([s['battery_remaining'] for s in stats], dtype=np.float64)
+        distance = np.array([s['distance_traveled'] for s in stats], dtype=np.float64)
+        deliveries = np.array([s['deliveries_completed'] for s in stats], dtype=np.int64)
+        if ids == self.ids:
+            # Only rows whose values moved are reported to the view
+            changed = np.flatnonzero((battery != self.battery) | (distance != self.distance) |
+                                     (deliveries != self.deliveries))
+            self.battery, self.distance, self.deliveries = battery, distance, deliveries
+            if len(changed):
+                self._format_cells()
+                self.dataChanged.emit(self.index(int(changed[0]), 1),
+                                      self.index(int(changed[-1]), len(self.HEADERS) - 1))
+        else:
+            # Rows added or removed: reset the whole view once
+            self.beginResetModel()
+            self.ids = ids
+            self.battery, self.distance, self.deliveries = battery, distance, deliveries
+            self._format_cells()
+            self.endResetModel()
+
+def _short_coords(coords):
+    return str(coords[:2]) + "..." if len(coords) > 2 else str(coords)
+
+# Remove-dialog columns: (header, cell text from the row object)
+_REMOVE_COLUMNS = {
+    'drone': [
+        ("ID", lambda d: d.id),
+        ("Position", lambda d: f"({d.current_position[0]:.1f}, {d.current_position[1]:.1f})"),
+        ("Battery", lambda d: f"{d.current_battery:.1f}%"),
+        ("Max Weight", lambda d: f"{d.max_weight:.1f}kg"),
+    ],
+    'delivery': [
+        ("ID", lambda d: d.id),
+        ("Position", lambda d: f"({d.position[0]:.1f}, {d.position[1]:.1f})"),
+        ("Weight", lambda d: f"{d.weight:.1f}kg"),
+        ("Priority", lambda d: str(d.priority)),
+        ("Status", lambda d: d.status),
+    ],
+    'zone': [
+        ("ID", lambda z: z.id),
+        ("Coordinates", lambda z: _short_coords(z.polygon_coordinates)),
+        ("Active Time", lambda z: f"{z.active_time_start.strftime('%H:%M')} - "
+                                  f"{z.active_time_end.strftime('%H:%M')}"),
+    ],
+}
+
+class ListTableModel(QAbstractTableModel):
+    """Read-only table over a list of objects.
+    
+    Cells are formatted the first time they are shown and then cached, so
+    repaints and scrolling are plain lookups.
+    """
+    def __init__(self, items, columns, parent=None):
+        super().__init__(parent)
+        self.items = items  # shared with the caller, rows are removed in place
+        self.columns = columns
+        self._cells = {}  # (row, column) -> text
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        key = (index.row(), index.column())
+        text = self._cells.get(key)
+        if text is None:
+            text = self._cells[key] = self.columns[key[1]][1](self.items[key[0]])
+        return text
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return str(section + 1)
+    
+    def remove_row(self, row):
+        """Remove one row from the view and from the underlying list."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.items[row]
+        self._cells.clear()  # rows below shifted up
+        self.endRemoveRows()
+
+def _make_list_view(model):
+    """Row-selecting table view over a ListTableModel.
+    
+    Row heights are fixed and columns are not fitted to their contents, so
+    the view only formats the cells it actually paints.
+    """
+    view = QTableView()
+    view.setModel(model)
+    view.setSelectionBehavior(QTableView.SelectRows)
+    view.setSortingEnabled(False)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    view.verticalHeader().setDefaultSectionSize(20)
+    return view
 
 class ReportPanel(QWidget):
     def __init__(self, parent=None):
@@ -114,9 +494,15 @@ class ReportPanel(QWidget):
         stats_group.setLayout(stats_layout)
         
         # Drone statistics table
-        self.drone_table = QTableWidget()
-        self.drone_table.setColumnCount(4)
-        self.drone_table.setHorizontalHeaderLabels(["Drone ID", "Battery", "Distance", "Deliveries"])
+        self.drone_model = DroneStatsModel(self)
+        self.drone_table = QTableView()
+        self.drone_table.setModel(self.drone_model)
+        # Fixed sections and no sorting: updates never trigger a size hint
+        # pass or a re-sort
+        self.drone_table.setSortingEnabled(False)
+        self.drone_table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.drone_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.drone_table.verticalHeader().setDefaultSectionSize(22)
         
         layout.addWidget(stats_group)
         layout.addWidget(QLabel("Drone Statistics:"))
@@ -124,33 +510,88 @@ class ReportPanel(QWidget):
         self.setLayout(layout)
         
     def update_report(self, report):
-        self.total_deliveries.setText(str(report['total_deliveries']))
-        self.completed_deliveries.setText(str(report['completed_deliveries']))
-        self.failed_deliveries.setText(str(report['failed_deliveries']))
-        self.in_progress_deliveries.setText(str(report['in_progress_deliveries']))
+        # One repaint for the labels and the table together
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_report(report)
+        finally:
+            self.setUpdatesEnabled(True)
+            
+    def _set_report(self, report):
+        for label, key in ((self.total_deliveries, 'total_deliveries'),
+                           (self.completed_deliveries, 'completed_deliveries'),
+                           (self.failed_deliveries, 'failed_deliveries'),
+                           (self.in_progress_deliveries, 'in_progress_deliveries')):
+            text = str(report[key])
+            if label.text() != text:
+                label.setText(text)
         
         # Update drone table
-        self.drone_table.setRowCount(len(report['drone_statistics']))
-        for i, (drone_id, stats) in enumerate(report['drone_statistics'].items()):
-            self.drone_table.setItem(i, 0, QTableWidgetItem(drone_id))
-            self.drone_table.setItem(i, 1, QTableWidgetItem(f"{stats['battery_remaining']:.1f}%"))
-            self.drone_table.setItem(i, 2, QTableWidgetItem(f"{stats['distance_traveled']:.1f}"))
-            self.drone_table.setItem(i, 3, QTableWidgetItem(str(stats['deliveries_completed'])))
+        self.drone_model.set_statistics(report['drone_statistics'])
 
-class OptimizerThread(QThread):
-    finished = pyqtSignal(dict)
-    def __init__(self, system, use_genetic, use_greedy=False):
+class OptimizerSignals(QObject):
+    finished = pyqtSignal(object, list, list, dict)  # Assignment, worker drones, worker deliveries, report
+    error = pyqtSignal(str)
+
+class OptimizerRunnable(QRunnable):
+    """One optimization job, run on a shared QThreadPool.
+    
+    The job only ever works on a copy of the system; the results are
+    handed to the GUI thread through `finished`, which applies them to
+    the live objects.
+    """
+    def __init__(self, system, use_genetic, use_greedy=False, executor=None):
         super().__init__()
-        self.system = system
+        # MainWindow keeps the Python reference; Qt must not delete it after run()
+        self.setAutoDelete(False)
+        self.signals = OptimizerSignals()
+        # Without a worker process, take the copy here, on the GUI thread
+        self.system = system if executor is not None else copy.deepcopy(system)
         self.use_genetic = use_genetic
         self.use_greedy = use_greedy
+        self.executor = executor
     def run(self):
         try:
-            assignment = self.system.optimize_deliveries(use_genetic=self.use_genetic, use_greedy=self.use_greedy)
+            if self.executor is None:
+                result = optimize_worker(self.system, self.use_genetic, self.use_greedy)
+            else:
+                future = self.executor.submit(optimize_worker, self.system,
+                                              self.use_genetic, self.use_greedy)
+                result = future.result()
+            assignment, drones, deliveries, report = result
         except Exception as e:
-            print(f"[OptimizerThread] Exception: {e}")
-            assignment = {}
-        self.finished.emit(assignment)
+            self.signals.error.emit(f"{type(e).__name__}: {e}")
+            return
+        self.signals.finished.emit(assignment, list(drones), list(deliveries), report)
+
+def apply_worker_result(system, assignment, drones, deliveries):
+    """Copy worker-side state onto the system's objects and remap the assignment's indices.
+    
+    Must run on the GUI thread, which also reads these objects to draw.
+    """
+    drone_rows = {d.id: i for i, d in enumerate(system.drones)}
+    for result in drones:
+        i = drone_rows.get(result.id)
+        if i is not None:
+            drone = system.drones[i]
+            drone.current_position = result.current_position
+            drone.current_battery = result.current_battery
+            drone.current_weight = result.current_weight
+            drone.route = result.route
+    delivery_rows = {d.id: j for j, d in enumerate(system.deliveries)}
+    for result in deliveries:
+        j = delivery_rows.get(result.id)
+        if j is not None:
+            delivery = system.deliveries[j]
+            delivery.status = result.status
+            delivery.assigned_drone = result.assigned_drone
+    # Worker row -> local row; -1 for anything removed meanwhile
+    drone_map = np.array([drone_rows.get(d.id, -1) for d in drones] + [-1], dtype=np.int32)
+    delivery_map = np.array([delivery_rows.get(d.id, -1) for d in deliveries] + [-1], dtype=np.int32)
+    drone_idx = drone_map[assignment.drone_idx]
+    delivery_idx = delivery_map[assignment.delivery_idx]
+    keep = (drone_idx >= 0) & (delivery_idx >= 0)
+    return Assignment(drone_idx[keep], delivery_idx[keep], assignment.stats)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -261,98 +702,78 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.map_canvas, 3)
         layout.addWidget(self.report_panel, 1)
         
+        # Görselleştirme: değişen gruplar birikir, toplu eklemelerde tek çizim yapılır
+        self._dirty = set(DIRTY_ALL)
+        self._batch_depth = 0
+        self._form_dialogs = {}
+        # Rapor yalnızca drone/teslimat değişince yeniden hesaplanır
+        self._cached_report = None
+        self._report_dirty = True
+        # Art arda gelen güncellemeler 30 ms içinde tek çizime birleşir
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._do_update_visualization)
+        
         # Update visualization
-        self.update_visualization()
+        self._do_update_visualization()
         
         self.optimizing_dialog = None
-        self.optimizer_thread = None
+        self.optimizer_job = None
+        self.thread_pool = QThreadPool.globalInstance()
+        
+        # Optimizasyon ayrı bir süreçte çalışır (GIL'e takılmadan); havuz tekrar kullanılır
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        
+    def closeEvent(self, event):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+        
+    def _form_dialog(self, kind, title):
+        """Build the add-dialog for kind on first use, then reuse it with fields reset."""
+        if kind not in self._form_dialogs:
+            dialog = QDialog(self)
+            dialog.setWindowTitle(title)
+            layout, fields = _make_form(dialog, _FIELD_SPECS[kind])
+            dialog.setLayout(layout)
+            self._form_dialogs[kind] = (dialog, fields)
+        dialog, fields = self._form_dialogs[kind]
+        for widget in fields.values():
+            if isinstance(widget, QLineEdit):
+                widget.clear()
+            else:
+                widget.setValue(widget.minimum())
+        return dialog, fields
         
     def show_add_drone_dialog(self):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Add New Drone")
-        layout = QFormLayout()
-        
-        id_input = QLineEdit()
-        max_weight = QDoubleSpinBox()
-        max_weight.setRange(0, 100)
-        battery = QDoubleSpinBox()
-        battery.setRange(0, 100000)
-        speed = QDoubleSpinBox()
-        speed.setRange(0, 100)
-        start_x = QDoubleSpinBox()
-        start_x.setRange(0, 100)
-        start_y = QDoubleSpinBox()
-        start_y.setRange(0, 100)
-        
-        layout.addRow("ID:", id_input)
-        layout.addRow("Max Weight:", max_weight)
-        layout.addRow("Battery Capacity:", battery)
-        layout.addRow("Speed:", speed)
-        layout.addRow("Start X:", start_x)
-        layout.addRow("Start Y:", start_y)
-        
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel,
-            Qt.Horizontal, dialog)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addRow(buttons)
-        
-        dialog.setLayout(layout)
+        dialog, fields = self._form_dialog('drone', "Add New Drone")
         
         if dialog.exec_() == QDialog.Accepted:
             drone = Drone(
-                id_input.text(),
-                max_weight.value(),
-                battery.value(),
-                speed.value(),
-                (start_x.value(), start_y.value())
+                fields['id'].text(),
+                fields['max_weight'].value(),
+                fields['battery'].value(),
+                fields['speed'].value(),
+                (fields['start_x'].value(), fields['start_y'].value())
             )
             self.system.add_drone(drone)
-            self.update_visualization()
+            self.update_visualization({'drones'})
             
     def show_add_delivery_dialog(self):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Add New Delivery")
-        layout = QFormLayout()
-        
-        id_input = QLineEdit()
-        pos_x = QDoubleSpinBox()
-        pos_x.setRange(0, 100)
-        pos_y = QDoubleSpinBox()
-        pos_y.setRange(0, 100)
-        weight = QDoubleSpinBox()
-        weight.setRange(0, 100)
-        priority = QSpinBox()
-        priority.setRange(1, 5)
-        
-        layout.addRow("ID:", id_input)
-        layout.addRow("Position X:", pos_x)
-        layout.addRow("Position Y:", pos_y)
-        layout.addRow("Weight:", weight)
-        layout.addRow("Priority:", priority)
-        
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel,
-            Qt.Horizontal, dialog)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addRow(buttons)
-        
-        dialog.setLayout(layout)
+        dialog, fields = self._form_dialog('delivery', "Add New Delivery")
         
         if dialog.exec_() == QDialog.Accepted:
             current_time = datetime.now()
             delivery = Delivery(
-                id_input.text(),
-                (pos_x.value(), pos_y.value()),
-                weight.value(),
-                priority.value(),
+                fields['id'].text(),
+                (fields['pos_x'].value(), fields['pos_y'].value()),
+                fields['weight'].value(),
+                fields['priority'].value(),
                 current_time,
                 current_time + timedelta(hours=1)
             )
             self.system.add_delivery(delivery)
-            self.update_visualization()
+            self.update_visualization({'deliveries'})
             
     def show_add_zone_dialog(self):
         dialog = QDialog(self)
@@ -448,13 +869,12 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "Error", "Please enter coordinates")
                     return
                 
-                coords = []
-                for point in coords_text.split(';'):
-                    x, y = map(float, point.split(','))
-                    if not (0 <= x <= 100 and 0 <= y <= 100):
-                        QMessageBox.warning(self, "Error", f"Coordinates must be between 0-100. Invalid point: ({x}, {y})")
-                        return
-                    coords.append((x, y))
+                coords = _parse_coords(coords_text)
+                out_of_range = ((coords < 0) | (coords > 100)).any(axis=1)
+                if out_of_range.any():
+                    x, y = coords[out_of_range.argmax()]
+                    QMessageBox.warning(self, "Error", f"Coordinates must be between 0-100. Invalid point: ({x}, {y})")
+                    return
                 
                 if len(coords) < 3:
                     QMessageBox.warning(self, "Error", "At least 3 coordinate points are required")
@@ -468,13 +888,13 @@ class MainWindow(QMainWindow):
                 # Create zone
                 zone = NoFlyZone(
                     zone_id,
-                    coords,
+                    coords.tolist(),
                     start_time,
                     end_time
                 )
                 
                 self.system.add_no_fly_zone(zone)
-                self.update_visualization()
+                self.update_visualization({'zones'})
                 
                 # Show success message
                 QMessageBox.information(
@@ -496,10 +916,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "Preview", "Please enter coordinates first")
                 return
             
-            coords = []
-            for point in coords_text.split(';'):
-                x, y = map(float, point.split(','))
-                coords.append((x, y))
+            coords = _parse_coords(coords_text)
             
             if len(coords) < 3:
                 QMessageBox.warning(self, "Preview", "At least 3 coordinate points are required")
@@ -513,146 +930,126 @@ class MainWindow(QMainWindow):
                 f"Zone will have {len(coords)} points:\n\n{coord_info}\n\nClick OK in the main dialog to create the zone."
             )
             
-        except Exception as e:
+        except ValueError as e:
             QMessageBox.warning(self, "Preview Error", f"Invalid coordinates: {str(e)}")
                 
     def optimize_deliveries(self):
-        # Show loading dialog
-        self.optimizing_dialog = QMessageBox(self)
+        # Show busy indicator (0..0 range = indeterminate, no cancel button)
+        self.optimizing_dialog = QProgressDialog("Optimization in progress. Please wait...", None, 0, 0, self)
         self.optimizing_dialog.setWindowTitle("Optimizing...")
-        self.optimizing_dialog.setText("Optimization in progress. Please wait...")
-        self.optimizing_dialog.setStandardButtons(QMessageBox.NoButton)
+        self.optimizing_dialog.setWindowModality(Qt.WindowModal)
+        self.optimizing_dialog.setMinimumDuration(0)
         self.optimizing_dialog.show()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         # Determine algorithm
         use_genetic = self.ga_radio.isChecked()
         use_greedy = self.greedy_radio.isChecked()
-        self.optimizer_thread = OptimizerThread(self.system, use_genetic=use_genetic, use_greedy=use_greedy)
-        self.optimizer_thread.finished.connect(self.on_optimization_finished)
-        self.optimizer_thread.start()
+        self.optimizer_job = OptimizerRunnable(self.system, use_genetic=use_genetic, use_greedy=use_greedy,
+                                               executor=self.executor)
+        self.optimizer_job.signals.finished.connect(self.on_optimization_finished)
+        self.optimizer_job.signals.error.connect(self.on_optimization_failed)
+        self.thread_pool.start(self.optimizer_job)
 
-    def on_optimization_finished(self, assignment):
-        self.system.execute_deliveries(assignment)
-        self.update_visualization()
+    def on_optimization_finished(self, assignment, drones, deliveries, report):
+        # Teslimatlar işçide yürütüldü; sonuçlar GUI thread'inde canlı nesnelere yazılır
+        apply_worker_result(self.system, assignment, drones, deliveries)
+        self.update_visualization(report=report)
+        # Optimize dialogu açıkken, optimizasyon tamamlandığında mutlaka kapat
+        self._end_optimizing()
         # Başarılı teslimat sayısı çok azsa veya hiç yoksa kullanıcıya uyarı göster
-        completed = sum(1 for d in self.system.deliveries if d.status == "completed")
-        total = len(self.system.deliveries)
+        completed = report['completed_deliveries']
+        total = report['total_deliveries']
         if completed < total // 3:  # Teslimatların üçte birinden azı başarılıysa uyarı ver
             QMessageBox.warning(self, "Optimizasyon Uyarısı", "Optimizasyonun büyük kısmı başarısız oldu.\nCSP algoritması karmaşık veriyle yavaş kalabilir.\nDaha hızlı sonuç için Greedy veya Genetic Algorithm seçebilirsiniz.")
-        # Optimize dialogu açıkken, optimizasyon tamamlandığında mutlaka kapat
+        
+    def on_optimization_failed(self, message):
+        print(f"[Optimizer] Exception: {message}")
+        self._end_optimizing()
+        QMessageBox.warning(self, "Optimizasyon Hatası", f"Optimizasyon başarısız oldu:\n{message}")
+        
+    def _end_optimizing(self):
+        """Close the busy dialog and restore the cursor."""
         if self.optimizing_dialog:
-            self.optimizing_dialog.done(0)
+            self.optimizing_dialog.reset()
             self.optimizing_dialog = None
-        self.optimizer_thread = None
+            QApplication.restoreOverrideCursor()
+        self.optimizer_job = None
+        
+    @contextmanager
+    def _batch_update(self):
+        """Defer update_visualization until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._do_update_visualization()
+                
+    def update_visualization(self, dirty=DIRTY_ALL, report=None):
+        """Queue a redraw of the groups in dirty; bursts within 30 ms coalesce into one.
+        
+        A report computed elsewhere (e.g. by the optimizer worker) is cached
+        as is; a later drone or delivery change without one invalidates it.
+        """
+        self._dirty.update(dirty)
+        if report is not None:
+            self._cached_report, self._report_dirty = report, False
+        elif 'drones' in dirty or 'deliveries' in dirty:
+            self._report_dirty = True
+        if not self._batch_depth:
+            self._redraw_timer.start(30)
+            
+    def _do_update_visualization(self):
+        """Redraw the pending dirty groups now unless batching."""
+        self._redraw_timer.stop()
+        if self._batch_depth or not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
         
-    def update_visualization(self):
         # Update map
         routes = {}
         for drone in self.system.drones:
             if len(drone.route) > 1:
-                routes[drone.id] = drone.route
+                routes[drone.id] = drone.route_array()
         self.map_canvas.update_plot(
-            self.system.drones,
-            self.system.deliveries,
+            self.system.snapshot(),
             self.system.no_fly_zones,
-            routes
+            routes,
+            dirty
         )
         
-        # Update report
-        report = self.system.generate_report()
-        self.report_panel.update_report(report)
+        # Update report (zones do not appear in it)
+        if 'drones' in dirty or 'deliveries' in dirty:
+            if self._report_dirty:
+                self._cached_report = self.system.generate_report()
+                self._report_dirty = False
+            self.report_panel.update_report(self._cached_report)
 
     def load_sample_data(self):
-        # Sample drones
-        drones = [
-            {"id": "1", "max_weight": 4.0, "battery": 12000, "speed": 8.0, "start_pos": (10, 10)},
-            {"id": "2", "max_weight": 3.5, "battery": 10000, "speed": 10.0, "start_pos": (20, 30)},
-            {"id": "3", "max_weight": 5.0, "battery": 15000, "speed": 7.0, "start_pos": (50, 50)},
-            {"id": "4", "max_weight": 2.0, "battery": 8000, "speed": 12.0, "start_pos": (80, 20)},
-            {"id": "5", "max_weight": 6.0, "battery": 20000, "speed": 5.0, "start_pos": (40, 70)}
-        ]
-        
-        # Sample deliveries
-        deliveries = [
-            {"id": "1", "pos": (15, 25), "weight": 1.5, "priority": 3, "time_window": (0, 60)},
-            {"id": "2", "pos": (30, 40), "weight": 2.0, "priority": 5, "time_window": (0, 30)},
-            {"id": "3", "pos": (70, 80), "weight": 3.0, "priority": 2, "time_window": (20, 80)},
-            {"id": "4", "pos": (90, 10), "weight": 1.0, "priority": 4, "time_window": (10, 40)},
-            {"id": "5", "pos": (45, 60), "weight": 4.0, "priority": 1, "time_window": (30, 90)},
-            {"id": "6", "pos": (25, 15), "weight": 2.5, "priority": 3, "time_window": (0, 50)},
-            {"id": "7", "pos": (60, 30), "weight": 1.0, "priority": 5, "time_window": (5, 25)},
-            {"id": "8", "pos": (85, 90), "weight": 3.5, "priority": 2, "time_window": (40, 100)},
-            {"id": "9", "pos": (10, 80), "weight": 2.0, "priority": 4, "time_window": (15, 45)},
-            {"id": "10", "pos": (95, 50), "weight": 1.5, "priority": 3, "time_window": (0, 60)},
-            {"id": "11", "pos": (55, 20), "weight": 0.5, "priority": 5, "time_window": (0, 20)},
-            {"id": "12", "pos": (35, 75), "weight": 2.0, "priority": 1, "time_window": (50, 120)},
-            {"id": "13", "pos": (75, 40), "weight": 3.0, "priority": 3, "time_window": (10, 50)},
-            {"id": "14", "pos": (20, 90), "weight": 1.5, "priority": 4, "time_window": (30, 70)},
-            {"id": "15", "pos": (65, 65), "weight": 4.5, "priority": 2, "time_window": (25, 75)},
-            {"id": "16", "pos": (40, 10), "weight": 2.0, "priority": 5, "time_window": (0, 30)},
-            {"id": "17", "pos": (5, 50), "weight": 1.0, "priority": 3, "time_window": (15, 55)},
-            {"id": "18", "pos": (50, 85), "weight": 3.0, "priority": 1, "time_window": (60, 100)},
-            {"id": "19", "pos": (80, 70), "weight": 2.5, "priority": 4, "time_window": (20, 60)},
-            {"id": "20", "pos": (30, 55), "weight": 1.5, "priority": 2, "time_window": (40, 80)}
-        ]
-        
-        # Sample no-fly zones
-        no_fly_zones = [
-            {
-                "id": "1",
-                "coordinates": [(40, 30), (60, 30), (60, 50), (40, 50)],
-                "active_time": (0, 120)
-            },
-            {
-                "id": "2",
-                "coordinates": [(70, 10), (90, 10), (90, 30), (70, 30)],
-                "active_time": (30, 90)
-            },
-            {
-                "id": "3",
-                "coordinates": [(10, 60), (30, 60), (30, 80), (10, 80)],
-                "active_time": (0, 60)
-            }
-        ]
-        
-        # Clear existing data
-        self.system = DroneDeliverySystem()
-        
-        # Add drones
-        for drone_data in drones:
-            drone = Drone(
-                str(drone_data["id"]),
-                drone_data["max_weight"],
-                drone_data["battery"],
-                drone_data["speed"],
-                drone_data["start_pos"]
-            )
-            self.system.add_drone(drone)
+        # Toplu ekleme: çizim with bloğunun sonunda bir kez yapılır
+        with self._batch_update():
+            # Clear existing data
+            self.system = DroneDeliverySystem()
+            current_time = datetime.now()
             
-        # Add deliveries
-        current_time = datetime.now()
-        for delivery_data in deliveries:
-            delivery = Delivery(
-                str(delivery_data["id"]),
-                delivery_data["pos"],
-                delivery_data["weight"],
-                delivery_data["priority"],
-                current_time + timedelta(minutes=delivery_data["time_window"][0]),
-                current_time + timedelta(minutes=delivery_data["time_window"][1])
-            )
-            self.system.add_delivery(delivery)
+            self.system.bulk_add_drones(_SAMPLE_DRONES)
+            self.update_visualization({'drones'})
             
-        # Add no-fly zones
-        for zone_data in no_fly_zones:
-            zone = NoFlyZone(
-                str(zone_data["id"]),
-                zone_data["coordinates"],
-                current_time + timedelta(minutes=zone_data["active_time"][0]),
-                current_time + timedelta(minutes=zone_data["active_time"][1])
-            )
-            self.system.add_no_fly_zone(zone)
+            self.system.bulk_add_deliveries(_SAMPLE_DELIVERIES, current_time)
+            self.update_visualization({'deliveries'})
+            
+            # Add no-fly zones
+            for zone_id, coordinates, (start, end) in _SAMPLE_ZONES:
+                zone = NoFlyZone(
+                    zone_id,
+                    coordinates,
+                    current_time + timedelta(minutes=start),
+                    current_time + timedelta(minutes=end)
+                )
+                self.system.add_no_fly_zone(zone)
+                self.update_visualization({'zones'})
             
-        # Update visualization
-        self.update_visualization()
         QMessageBox.information(self, "Success", "Sample data loaded successfully!")
     
     def reset_all_data(self):
@@ -743,51 +1140,50 @@ class MainWindow(QMainWindow):
                 self.system.no_fly_zones
             )
             
-            # Detaylı bilgi hazırla
-            status_text = "🤖 DRONE DELIVERY SYSTEM STATUS 🚁\n\n"
-            status_text += "=" * 50 + "\n"
-            status_text += f"📊 GENEL BİLGİLER\n"
-            status_text += f"Toplam Drone: {summary['total_drones']}\n"
-            status_text += f"Toplam Delivery: {summary['total_deliveries']}\n"
-            status_text += f"Toplam No-Fly Zone: {summary['total_no_fly_zones']}\n\n"
+            # Detaylı bilgi hazırla (satırlar listede toplanıp bir kez birleştirilir)
+            parts = ["🤖 DRONE DELIVERY SYSTEM STATUS 🚁", "", "=" * 50,
+                     "📊 GENEL BİLGİLER",
+                     f"Toplam Drone: {summary['total_drones']}",
+                     f"Toplam Delivery: {summary['total_deliveries']}",
+                     f"Toplam No-Fly Zone: {summary['total_no_fly_zones']}", ""]
+            append = parts.append
             
             if summary['drone_statuses']:
-                status_text += f"🚁 DRONE DURUMLARI\n"
+                append("🚁 DRONE DURUMLARI")
                 for status, count in summary['drone_statuses'].items():
-                    emoji = "✅" if status == "available" else "🔄" if status == "busy" else "⚠️"
-                    status_text += f"{emoji} {status.title()}: {count}\n"
-                status_text += "\n"
+                    append(f"{_DRONE_STATUS_EMOJI.get(status, '⚠️')} {status.title()}: {count}")
+                append("")
             
             if summary['delivery_statuses']:
-                status_text += f"📦 DELIVERY DURUMLARI\n"
+                append("📦 DELIVERY DURUMLARI")
                 for status, count in summary['delivery_statuses'].items():
-                    emoji = "⏳" if status == "pending" else "✅" if status == "completed" else "❌" if status == "failed" else "🔄"
-                    status_text += f"{emoji} {status.title()}: {count}\n"
-                status_text += "\n"
+                    append(f"{_DELIVERY_STATUS_EMOJI.get(status, '🔄')} {status.title()}: {count}")
+                append("")
             
             # Detaylı drone bilgileri
             if self.system.drones:
-                status_text += f"🔧 DETAYLI DRONE BİLGİLERİ\n"
+                append("🔧 DETAYLI DRONE BİLGİLERİ")
                 for drone in self.system.drones:
                     battery_emoji = "🔋" if drone.current_battery > 50 else "🪫" if drone.current_battery > 20 else "⚡"
-                    status_text += f"{battery_emoji} {drone.id}: "
-                    status_text += f"Pos({drone.current_position[0]:.1f},{drone.current_position[1]:.1f}) "
-                    status_text += f"Battery:{drone.current_battery:.1f}% "
-                    status_text += f"Load:{drone.max_weight}kg\n"
-                status_text += "\n"
+                    append(f"{battery_emoji} {drone.id}: "
+                           f"Pos({drone.current_position[0]:.1f},{drone.current_position[1]:.1f}) "
+                           f"Battery:{drone.current_battery:.1f}% "
+                           f"Load:{drone.max_weight}kg")
+                append("")
             
             # Optimizasyon durumu
+            append("⚙️ OPTİMİZASYON DURUMU")
             if hasattr(self.system, 'optimizer') and self.system.optimizer:
-                status_text += f"⚙️ OPTİMİZASYON DURUMU\n"
-                status_text += f"✅ Optimizer aktif\n"
+                append("✅ Optimizer aktif")
                 if hasattr(self.system.optimizer, 'assignment'):
                     total_assignments = sum(len(deliveries) for deliveries in self.system.optimizer.assignment.values())
-                    status_text += f"📋 Toplam atama: {total_assignments}\n"
+                    append(f"📋 Toplam atama: {total_assignments}")
             else:
-                status_text += f"⚙️ OPTİMİZASYON DURUMU\n"
-                status_text += f"❌ Optimizer henüz çalıştırılmadı\n"
+                append("❌ Optimizer henüz çalıştırılmadı")
             
-            status_text += "\n" + "=" * 50
+            append("")
+            append("=" * 50)
+            status_text = "\n".join(parts)
             
             # Mesaj kutusunda göster
             msg = QMessageBox(self)
@@ -839,17 +1235,8 @@ class MainWindow(QMainWindow):
         layout.addWidget(info_label)
         
         # Drone listesi
-        drone_list = QTableWidget()
-        drone_list.setColumnCount(4)
-        drone_list.setHorizontalHeaderLabels(["ID", "Position", "Battery", "Max Weight"])
-        drone_list.setRowCount(len(self.system.drones))
-        drone_list.setSelectionBehavior(QTableWidget.SelectRows)
-        
-        for i, drone in enumerate(self.system.drones):
-            drone_list.setItem(i, 0, QTableWidgetItem(drone.id))
-            drone_list.setItem(i, 1, QTableWidgetItem(f"({drone.current_position[0]:.1f}, {drone.current_position[1]:.1f})"))
-            drone_list.setItem(i, 2, QTableWidgetItem(f"{drone.current_battery:.1f}%"))
-            drone_list.setItem(i, 3, QTableWidgetItem(f"{drone.max_weight:.1f}kg"))
+        drone_model = ListTableModel(self.system.drones, _REMOVE_COLUMNS['drone'], dialog)
+        drone_list = _make_list_view(drone_model)
         
         layout.addWidget(drone_list)
         
@@ -879,14 +1266,14 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Yes:
                 try:
                     # System'den sil
-                    self.system.drones.remove(drone)
+                    drone_model.remove_row(row)
                     
                     # Optimizer varsa oradan da sil
                     if hasattr(self.system, 'optimizer') and self.system.optimizer:
                         self.system.optimizer.remove_drone(drone.id)
                     
                     # Görselleştirmeyi güncelle
-                    self.update_visualization()
+                    self.update_visualization({'drones', 'routes'})
                     
                     QMessageBox.information(dialog, "Success", f"Drone '{drone.id}' silindi!")
                     dialog.accept()
@@ -923,19 +1310,8 @@ class MainWindow(QMainWindow):
         layout.addWidget(info_label)
         
         # Delivery listesi
-        delivery_list = QTableWidget()
-        delivery_list.setColumnCount(5)
-        delivery_list.setHorizontalHeaderLabels(["ID", "Position", "Weight", "Priority", "Status"])
-        delivery_list.setRowCount(len(self.system.deliveries))
-        delivery_list.setSelectionBehavior(QTableWidget.SelectRows)
-        
-        for i, delivery in enumerate(self.system.deliveries):
-            delivery_list.setItem(i, 0, QTableWidgetItem(delivery.id))
-            delivery_list.setItem(i, 1, QTableWidgetItem(f"({delivery.position[0]:.1f}, {delivery.position[1]:.1f})"))
-            delivery_list.setItem(i, 2, QTableWidgetItem(f"{delivery.weight:.1f}kg"))
-            delivery_list.setItem(i, 3, QTableWidgetItem(str(delivery.priority)))
-            status = getattr(delivery, 'status', 'pending')
-            delivery_list.setItem(i, 4, QTableWidgetItem(status))
+        delivery_model = ListTableModel(self.system.deliveries, _REMOVE_COLUMNS['delivery'], dialog)
+        delivery_list = _make_list_view(delivery_model)
         
         layout.addWidget(delivery_list)
         
@@ -965,14 +1341,14 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Yes:
                 try:
                     # System'den sil
-                    self.system.deliveries.remove(delivery)
+                    delivery_model.remove_row(row)
                     
                     # Optimizer varsa oradan da sil
                     if hasattr(self.system, 'optimizer') and self.system.optimizer:
                         self.system.optimizer.remove_delivery(delivery.id)
                     
                     # Görselleştirmeyi güncelle
-                    self.update_visualization()
+                    self.update_visualization({'deliveries'})
                     
                     QMessageBox.information(dialog, "Success", f"Delivery '{delivery.id}' silindi!")
                     dialog.accept()
@@ -1009,22 +1385,8 @@ class MainWindow(QMainWindow):
         layout.addWidget(info_label)
         
         # Zone listesi
-        zone_list = QTableWidget()
-        zone_list.setColumnCount(3)
-        zone_list.setHorizontalHeaderLabels(["ID", "Coordinates", "Active Time"])
-        zone_list.setRowCount(len(self.system.no_fly_zones))
-        zone_list.setSelectionBehavior(QTableWidget.SelectRows)
-        
-        for i, zone in enumerate(self.system.no_fly_zones):
-            zone_list.setItem(i, 0, QTableWidgetItem(getattr(zone, 'id', f"Zone-{i+1}")))
-            
-            # Koordinatları kısalt
-            coords = str(zone.polygon_coordinates[:2]) + "..." if len(zone.polygon_coordinates) > 2 else str(zone.polygon_coordinates)
-            zone_list.setItem(i, 1, QTableWidgetItem(coords))
-            
-            # Aktif zamanı - doğru attribute isimlerini kullan
-            active_time = f"{zone.active_time_start.strftime('%H:%M')} - {zone.active_time_end.strftime('%H:%M')}"
-            zone_list.setItem(i, 2, QTableWidgetItem(active_time))
+        zone_model = ListTableModel(self.system.no_fly_zones, _REMOVE_COLUMNS['zone'], dialog)
+        zone_list = _make_list_view(zone_model)
         
         layout.addWidget(zone_list)
         
@@ -1042,7 +1404,7 @@ class MainWindow(QMainWindow):
             
             row = selected_rows[0].row()
             zone = self.system.no_fly_zones[row]
-            zone_id = getattr(zone, 'id', f"Zone-{row+1}")
+            zone_id = zone.id
             
             reply = QMessageBox.question(
                 dialog,
@@ -1055,7 +1417,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Yes:
                 try:
                     # System'den sil
-                    self.system.no_fly_zones.remove(zone)
+                    zone_model.remove_row(row)
                     
                     # Optimizer varsa oradan da sil
                     if hasattr(self.system, 'optimizer') and self.system.optimizer:
@@ -1063,7 +1425,7 @@ class MainWindow(QMainWindow):
                             self.system.optimizer.no_fly_zones.remove(zone)
                     
                     # Görselleştirmeyi güncelle
-                    self.update_visualization()
+                    self.update_visualization({'zones'})
                     
                     QMessageBox.information(dialog, "Success", f"No-fly zone '{zone_id}' silindi!")
                     dialog.accept()
@@ -1087,5 +1449,7 @@ def main():
     window.show()
     sys.exit(app.exec_())
 
+# run_gui.py is the preferred launcher: started as `python gui.py`, every
+# spawned optimizer worker re-imports this module and with it PyQt5
 if __name__ == '__main__':
     main()
\ No newline at end of file
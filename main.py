@@ -1,42 +1,81 @@
-import json
+import orjson
 import argparse
+import time
+from collections import Counter
+from itertools import starmap
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple
 import numpy as np
-from drone import Drone
-from delivery import Delivery
-from zone import NoFlyZone
-from routing import AStarRouter
-from optimizer import DeliveryOptimizer, GeneticOptimizer
-from visualizer import DeliveryVisualizer
+from drone import Drone, DroneArrays, route_length
+from delivery import Delivery, DeliveryArrays, DeliveryStatus
+from zone import NoFlyZone, ZoneIndex
+from routing import shared_router
+from optimizer import Assignment, DeliveryOptimizer, GeneticOptimizer
 
 class DroneDeliverySystem:
     def __init__(self, config_file: str = None):
-        self.drones: List[Drone] = []
-        self.deliveries: List[Delivery] = []
-        self.no_fly_zones: List[NoFlyZone] = []
+        self._drones: List[Drone] = []
+        self._deliveries: List[Delivery] = []
+        self._no_fly_zones: List[NoFlyZone] = []
+        self._config = None  # parsed config whose objects are not built yet
+        self._pending_zones: List[NoFlyZone] = []  # zones of that config, already validated
         self.current_time = datetime.now()
         self.grid_size = (100, 100)  # Default grid size
+        # Structure-of-arrays mirrors used by the optimizers' vectorized math
+        self.drone_arrays = DroneArrays()
+        self.delivery_arrays = DeliveryArrays()
         
         if config_file:
             self.load_config(config_file)
     
+    # The object lists are built from a loaded config on first access
+    @property
+    def drones(self) -> List[Drone]:
+        if self._config is not None:
+            self._materialize()
+        return self._drones
+    
+    @property
+    def deliveries(self) -> List[Delivery]:
+        if self._config is not None:
+            self._materialize()
+        return self._deliveries
+    
+    @property
+    def no_fly_zones(self) -> List[NoFlyZone]:
+        if self._config is not None:
+            self._materialize()
+        return self._no_fly_zones
+    
+    def _materialize(self):
+        """Build the objects of the pending config, each kind in one pass."""
+        config = self._config
+        # Build everything before touching the lists, so a bad record leaves
+        # the config pending instead of a half-loaded system
+        drones = list(map(Drone.from_dict, config.get('drones', ())))
+        deliveries = [Delivery.from_dict(dict(data)) for data in config.get('deliveries', ())]
+        zones, self._pending_zones = self._pending_zones, []
+        self._config = None
+        self.add_drones(drones)
+        self.add_deliveries(deliveries)
+        self._no_fly_zones.extend(zones)
+    
     def load_config(self, config_file: str):
-        """Load configuration from JSON file."""
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        """Load configuration from JSON file.
         
-        # Load drones
-        for drone_data in config.get('drones', []):
-            self.drones.append(Drone.from_dict(drone_data))
+        Drones and deliveries are only built when the lists are first used,
+        so a load followed by a save never rebuilds them. Zones are built
+        right away, so an invalid polygon fails the load.
+        """
+        with open(config_file, 'rb') as f:
+            config = orjson.loads(f.read())
+        # from_dict rewrites the timestamps in place; keep the parsed records intact for save_config
+        zones = [NoFlyZone.from_dict(dict(data)) for data in config.get('no_fly_zones', ())]
         
-        # Load deliveries
-        for delivery_data in config.get('deliveries', []):
-            self.deliveries.append(Delivery.from_dict(delivery_data))
-        
-        # Load no-fly zones
-        for zone_data in config.get('no_fly_zones', []):
-            self.no_fly_zones.append(NoFlyZone.from_dict(zone_data))
+        if self._config is not None:
+            self._materialize()
+        self._config = config
+        self._pending_zones = zones
         
         # Load grid size if specified
         if 'grid_size' in config:
@@ -44,71 +83,149 @@ class DroneDeliverySystem:
     
     def save_config(self, config_file: str):
         """Save current configuration to JSON file."""
-        config = {
-            'drones': [drone.to_dict() for drone in self.drones],
-            'deliveries': [delivery.to_dict() for delivery in self.deliveries],
-            'no_fly_zones': [zone.to_dict() for zone in self.no_fly_zones],
-            'grid_size': self.grid_size
-        }
+        if self._config is not None and not (self._drones or self._deliveries or self._no_fly_zones):
+            # Nothing was built or changed since loading: write the parsed config back
+            config = {
+                'drones': self._config.get('drones', []),
+                'deliveries': self._config.get('deliveries', []),
+                'no_fly_zones': self._config.get('no_fly_zones', []),
+                'grid_size': self.grid_size
+            }
+        else:
+            config = {
+                'drones': [drone.to_dict() for drone in self.drones],
+                'deliveries': [delivery.to_dict() for delivery in self.deliveries],
+                'no_fly_zones': [zone.to_dict() for zone in self.no_fly_zones],
+                'grid_size': self.grid_size
+            }
         
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
     
     def add_drone(self, drone: Drone):
         """Add a new drone to the fleet."""
         self.drones.append(drone)
+        self.drone_arrays.append(drone)
     
     def add_delivery(self, delivery: Delivery):
         """Add a new delivery point."""
         self.deliveries.append(delivery)
+        self.delivery_arrays.append(delivery)
+    
+    def add_drones(self, drones: List[Drone]):
+        """Add several drones at once."""
+        self.drones.extend(drones)
+        self.drone_arrays.extend(drones)
+    
+    def add_deliveries(self, deliveries: List[Delivery]):
+        """Add several delivery points at once."""
+        self.deliveries.extend(deliveries)
+        self.delivery_arrays.extend(deliveries)
+    
+    def bulk_add_drones(self, records: np.ndarray):
+        """Add drones from a structured array with id, max_weight, battery,
+        speed and x/y start position fields."""
+        self.add_drones(list(starmap(Drone, zip(
+            records['id'].tolist(), records['max_weight'].tolist(), records['battery'].tolist(),
+            records['speed'].tolist(), zip(records['x'].tolist(), records['y'].tolist())))))
+    
+    def bulk_add_deliveries(self, records: np.ndarray, base_time: datetime):
+        """Add deliveries from a structured array with id, x/y position, weight,
+        priority and t0/t1 time-window fields in minutes after base_time."""
+        base = np.datetime64(base_time, 'us')
+        minute = np.timedelta64(1, 'm')
+        starts = (base + records['t0'] * minute).tolist()
+        ends = (base + records['t1'] * minute).tolist()
+        self.add_deliveries(list(starmap(Delivery, zip(
+            records['id'].tolist(), zip(records['x'].tolist(), records['y'].tolist()),
+            records['weight'].tolist(), records['priority'].tolist(), starts, ends))))
     
     def add_no_fly_zone(self, zone: NoFlyZone):
         """Add a new no-fly zone."""
         self.no_fly_zones.append(zone)
 
+    def sync_arrays(self):
+        """Bring the SoA mirrors in line with the drone/delivery lists.
+
+        The lists may be edited directly (e.g. by the GUI), so mirrors are
+        rebuilt when the ids no longer line up and refreshed otherwise.
+        """
+        if self.drone_arrays.matches(self.drones):
+            self.drone_arrays.refresh(self.drones)
+        else:
+            self.drone_arrays = DroneArrays.from_drones(self.drones)
+        if self.delivery_arrays.matches(self.deliveries):
+            self.delivery_arrays.refresh_statuses(self.deliveries)
+        else:
+            self.delivery_arrays = DeliveryArrays.from_deliveries(self.deliveries)
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Structure-of-arrays view of the current state, for drawing.
+
+        The arrays are views into the mirrors and are only valid until the
+        next change to the fleet.
+        """
+        self.sync_arrays()
+        return {
+            'drone_ids': self.drone_arrays.ids,
+            'drone_pos': self.drone_arrays.positions,
+            'drone_battery_pct': self.drone_arrays.battery_percentages,
+            'delivery_pos': self.delivery_arrays.positions,
+            'delivery_status': self.delivery_arrays.statuses,
+            'delivery_priority': self.delivery_arrays.priorities,
+        }
+
     def optimize_deliveries(self, use_genetic: bool = False, use_greedy: bool = False) -> Dict:
         """Optimize delivery assignments using either CSP, GA, or Greedy."""
+        self.sync_arrays()
+        # The router (and its zone-penalty memo) is shared with execution and later runs
+        router = shared_router(tuple(self.grid_size))
+        arrays = {'drone_arrays': self.drone_arrays, 'delivery_arrays': self.delivery_arrays,
+                  'router': router}
         if use_greedy:
-            optimizer = GeneticOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time)
+            optimizer = GeneticOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time, **arrays)
             assignment = optimizer.solve_greedy()
         elif use_genetic:
-            optimizer = GeneticOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time)
+            optimizer = GeneticOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time, **arrays)
             try:
                 assignment = optimizer.solve()
             except Exception as e:
                 print(f"[GA] Exception: {e}. Falling back to greedy.")
                 assignment = optimizer.solve_greedy()
         else:
-            optimizer = DeliveryOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time)
+            optimizer = DeliveryOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time,
+                                          router=router)
             try:
                 assignment = optimizer.solve_csp(timeout_seconds=30.0)  # 30 saniye timeout
             except Exception as e:
                 print(f"[CSP] Exception: {e}. Falling back to greedy.")
-                greedy_optimizer = GeneticOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time)
+                greedy_optimizer = GeneticOptimizer(self.drones, self.deliveries, self.no_fly_zones, self.current_time, **arrays)
                 assignment = greedy_optimizer.solve_greedy()
         return assignment
     
-    def execute_deliveries(self, assignment: Dict[str, List[Delivery]]):
-        """Execute the delivery assignments."""
-        router = AStarRouter(self.grid_size)
-        for drone_id, deliveries in assignment.items():
-            drone = next(d for d in self.drones if d.id == drone_id)
+    def execute_deliveries(self, assignment):
+        """Execute the delivery assignments (a {drone_id: [Delivery]} dict or an Assignment)."""
+        router = shared_router(tuple(self.grid_size))
+        # Zone activity does not change during execution; index the active zones once
+        zone_index = ZoneIndex(self.no_fly_zones, self.current_time)
+        if isinstance(assignment, Assignment):
+            # Index pairs into the current lists, already grouped per drone
+            pairs = ((self.drones[i], [self.deliveries[j]])
+                     for i, j in zip(assignment.drone_idx.tolist(), assignment.delivery_idx.tolist()))
+        else:
+            drones_by_id = {drone.id: drone for drone in self.drones}
+            pairs = ((drones_by_id[drone_id], deliveries)
+                     for drone_id, deliveries in assignment.items())
+        for drone, deliveries in pairs:
             for delivery in deliveries:
                 # Find path to delivery point
                 path = router.find_path(drone.current_position, delivery.position,
                                       drone, self.no_fly_zones, self.current_time)
                 # Check for no-fly zone intersections
-                valid = path and not any(
-                    zone.is_active(self.current_time) and any(
-                        zone.intersects_line(path[i], path[i+1])
-                        for i in range(len(path)-1)
-                    ) for zone in self.no_fly_zones)
+                valid = path and not zone_index.path_intersects(path)
                 if valid:
-                    # Update drone position and battery
-                    for i in range(len(path) - 1):
-                        distance = np.sqrt((path[i+1][0] - path[i][0])**2 +
-                                         (path[i+1][1] - path[i][1])**2)
-                        drone.update_position(path[i+1], distance)
+                    # Update drone position and battery for the whole path at once
+                    drone.update_route(path[1:], route_length(path))
                     # Mark delivery as completed
                     delivery.mark_completed()
                 else:
@@ -116,25 +233,41 @@ class DroneDeliverySystem:
     
     def generate_report(self) -> Dict:
         """Generate delivery execution report."""
+        self.sync_arrays()
+        status_counts = np.bincount(self.delivery_arrays.statuses, minlength=len(DeliveryStatus)).tolist()
+        completed_by = Counter(d.assigned_drone for d in self.deliveries if d.status == "completed")
         report = {
             'total_deliveries': len(self.deliveries),
-            'completed_deliveries': sum(1 for d in self.deliveries if d.status == "completed"),
-            'failed_deliveries': sum(1 for d in self.deliveries if d.status == "failed"),
-            'in_progress_deliveries': sum(1 for d in self.deliveries if d.status == "in_progress"),
+            'completed_deliveries': status_counts[DeliveryStatus.COMPLETED],
+            'failed_deliveries': status_counts[DeliveryStatus.FAILED],
+            'in_progress_deliveries': status_counts[DeliveryStatus.IN_PROGRESS],
             'drone_statistics': {}
         }
         
-        for drone in self.drones:
+        for drone, battery in zip(self.drones, self.drone_arrays.battery_percentages.tolist()):
             report['drone_statistics'][drone.id] = {
-                'battery_remaining': drone.get_remaining_battery_percentage(),
-                'distance_traveled': sum(np.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-                                      for p1, p2 in zip(drone.route[:-1], drone.route[1:])),
-                'deliveries_completed': sum(1 for d in self.deliveries 
-                                         if d.assigned_drone == drone.id and d.status == "completed")
+                'battery_remaining': battery,
+                'distance_traveled': route_length(drone.route_array()),
+                'deliveries_completed': completed_by[drone.id]
             }
         
         return report
 
+def optimize_worker(system: DroneDeliverySystem, use_genetic: bool, use_greedy: bool):
+    """Optimize, execute and report in one call, e.g. in a worker process.
+
+    The system arrives as a pickled copy, so the assignment is also
+    executed and reported here; the resulting drone and delivery states
+    are sent back with it and the GUI thread only has to paint. Living in
+    this module keeps Qt and the GUI out of the worker's imports.
+    """
+    start = time.perf_counter()
+    mapping = system.optimize_deliveries(use_genetic=use_genetic, use_greedy=use_greedy)
+    assignment = Assignment.from_mapping(mapping, system.drones, system.deliveries,
+                                         elapsed=time.perf_counter() - start)
+    system.execute_deliveries(assignment)
+    return assignment, system.drones, system.deliveries, system.generate_report()
+
 def main():
     parser = argparse.ArgumentParser(description='Drone Delivery Fleet Optimization System')
     parser.add_argument('--config', type=str, help='Path to configuration file')
@@ -145,11 +278,10 @@ def main():
     # Initialize system
     system = DroneDeliverySystem(args.config)
     
-    # Create visualizer
-    visualizer = DeliveryVisualizer(system.grid_size)
-    
-    # Plot initial state
+    # Plot initial state; pyplot is only loaded when plots are requested
     if args.visualize:
+        from visualizer import DeliveryVisualizer
+        visualizer = DeliveryVisualizer(system.grid_size)
         visualizer.plot_scenario(system.drones, system.deliveries,
                                system.no_fly_zones, system.current_time)
         visualizer.show()
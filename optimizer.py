@@ -1,27 +1,77 @@
-from typing import List, Dict, Tuple, Set
-import random
+from typing import List, Dict, Tuple, Set, Optional
+from dataclasses import dataclass, field
+from bisect import insort
+from operator import attrgetter
 import numpy as np
 from datetime import datetime, timedelta
-from drone import Drone
-from delivery import Delivery
-from zone import NoFlyZone
+from drone import Drone, DroneArrays, euclid, route_length, distance_matrix
+from delivery import Delivery, DeliveryArrays
+from zone import NoFlyZone, ZoneIndex
 from routing import AStarRouter
 import time
 
+@dataclass
+class Assignment:
+    """Compact optimizer result: (drone index, delivery index) pairs in execution order."""
+    drone_idx: np.ndarray
+    delivery_idx: np.ndarray
+    stats: dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, List[Delivery]], drones: List[Drone],
+                     deliveries: List[Delivery], **stats) -> 'Assignment':
+        """Encode a {drone_id: [Delivery, ...]} assignment against the given lists."""
+        drone_index = {drone.id: i for i, drone in enumerate(drones)}
+        delivery_index = {id(delivery): j for j, delivery in enumerate(deliveries)}
+        pairs = [(drone_index[drone_id], delivery_index[id(delivery)])
+                 for drone_id, assigned in mapping.items() for delivery in assigned]
+        pairs = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+        return cls(pairs[:, 0].copy(), pairs[:, 1].copy(), stats)
+    
+    def __len__(self) -> int:
+        return len(self.delivery_idx)
+    
+    def to_mapping(self, drones: List[Drone], deliveries: List[Delivery]) -> Dict[str, List[Delivery]]:
+        """Decode back into a {drone_id: [Delivery, ...]} dict."""
+        mapping = {drone.id: [] for drone in drones}
+        for i, j in zip(self.drone_idx.tolist(), self.delivery_idx.tolist()):
+            mapping[drones[i].id].append(deliveries[j])
+        return mapping
+
+@dataclass(slots=True)
+class DroneState:
+    """Drone fields restored by reset_all_data."""
+    position: Tuple[float, float]
+    battery: float
+    status: str = 'available'
+
+@dataclass(slots=True)
+class DeliveryState:
+    """Delivery fields restored by reset_all_data."""
+    status: str = 'pending'
+    assigned_drone: Optional[str] = None
+
+def _drone_state(drone: Drone) -> DroneState:
+    return DroneState(tuple(drone.current_position), drone.current_battery,
+                      getattr(drone, 'status', 'available'))
+
+def _delivery_state(delivery: Delivery) -> DeliveryState:
+    return DeliveryState(delivery.status, delivery.assigned_drone)
+
 class DataManager:
     """Drone, Delivery ve No-Fly Zone verilerini yönetmek için yardımcı sınıf"""
     
     @staticmethod
-    def reset_drones(drones: List[Drone], initial_states: Dict = None):
+    def reset_drones(drones: List[Drone], initial_states: Dict[str, DroneState] = None):
         """Drone'ları başlangıç durumuna sıfırla"""
         for drone in drones:
             if initial_states and drone.id in initial_states:
                 state = initial_states[drone.id]
-                drone.current_position = list(state['position'])
-                drone.current_battery = state['battery']
+                drone.current_position = list(state.position)
+                drone.current_battery = state.battery
                 drone.route = []
                 if hasattr(drone, 'status'):
-                    drone.status = state.get('status', 'available')
+                    drone.status = state.status
             else:
                 # Varsayılan sıfırlama
                 drone.route = []
@@ -29,15 +79,13 @@ class DataManager:
                     drone.status = 'available'
     
     @staticmethod
-    def reset_deliveries(deliveries: List[Delivery], initial_states: Dict = None):
+    def reset_deliveries(deliveries: List[Delivery], initial_states: Dict[str, DeliveryState] = None):
         """Delivery'leri başlangıç durumuna sıfırla"""
         for delivery in deliveries:
             if initial_states and delivery.id in initial_states:
                 state = initial_states[delivery.id]
-                if hasattr(delivery, 'status'):
-                    delivery.status = state.get('status', 'pending')
-                if hasattr(delivery, 'assigned_drone'):
-                    delivery.assigned_drone = state.get('assigned_drone', None)
+                delivery.status = state.status
+                delivery.assigned_drone = state.assigned_drone
             else:
                 # Varsayılan sıfırlama
                 if hasattr(delivery, 'status'):
@@ -103,38 +151,49 @@ class DataManager:
         
         print("="*50 + "\n")
 
+def _zones_key(no_fly_zones: List[NoFlyZone]) -> Tuple:
+    """Content key of a zone list: vertices and active window of every zone."""
+    return tuple((zone.path.vertices.tobytes(), zone.active_time_start, zone.active_time_end)
+                 for zone in no_fly_zones)
+
+def _zone_index(cache: Dict, zones_key: Tuple, no_fly_zones: List[NoFlyZone], when: datetime) -> ZoneIndex:
+    """ZoneIndex for the zones active at `when`, reused while the zone list is unchanged.
+    
+    zones_key is _zones_key(no_fly_zones), computed once per solve by the
+    caller; keying on content rather than length means swapping one zone
+    for another (the GUI edits the list in place) builds a fresh index.
+    """
+    key = (zones_key, when)
+    index = cache.get(key)
+    if index is None:
+        if len(cache) >= 64:
+            cache.clear()
+        index = cache[key] = ZoneIndex(no_fly_zones, when)
+    return index
+
 class DeliveryOptimizer:
     def __init__(self, drones: List[Drone], deliveries: List[Delivery], 
-                 no_fly_zones: List[NoFlyZone], current_time: datetime):
+                 no_fly_zones: List[NoFlyZone], current_time: datetime, router: AStarRouter = None):
         if not drones or not deliveries:
             raise ValueError("DeliveryOptimizer: Drone ve teslimat listeleri boş olamaz!")
         self.drones = drones
-        self.deliveries = sorted(deliveries)  # Sort by priority and deadline
+        self.deliveries = sorted(deliveries, key=attrgetter('sort_key'))  # Sort by priority and deadline
         self.no_fly_zones = no_fly_zones
         self.current_time = current_time
+        self._now = current_time.timestamp()
         self.assignment: Dict[str, List[Delivery]] = {drone.id: [] for drone in drones}
-        self.router = AStarRouter((100, 100))  # Use default grid size or pass as needed
+        self.router = router if router is not None else AStarRouter((100, 100))
+        self._zone_indexes: Dict = {}
+        self._zones_key = _zones_key(no_fly_zones)
         
         # Başlangıç durumlarını sakla (reset için)
         self._store_initial_states()
     
     def _store_initial_states(self):
         """Başlangıç durumlarını sakla - reset için kullanılacak"""
-        self.initial_drone_states = {}
-        for drone in self.drones:
-            self.initial_drone_states[drone.id] = {
-                'position': tuple(drone.current_position),  # tuple olarak sakla
-                'battery': drone.current_battery,
-                'route': [],
-                'status': getattr(drone, 'status', 'available')
-            }
-        
-        self.initial_delivery_states = {}
-        for delivery in self.deliveries:
-            self.initial_delivery_states[delivery.id] = {
-                'status': getattr(delivery, 'status', 'pending'),
-                'assigned_drone': getattr(delivery, 'assigned_drone', None)
-            }
+        self.initial_drone_states: Dict[str, DroneState] = {drone.id: _drone_state(drone) for drone in self.drones}
+        self.initial_delivery_states: Dict[str, DeliveryState] = {
+            delivery.id: _delivery_state(delivery) for delivery in self.deliveries}
     
     def reset_all_data(self):
         """Tüm drone'ları, delivery'leri ve assignment'ları başlangıç durumuna sıfırla"""
@@ -144,20 +203,18 @@ class DeliveryOptimizer:
         for drone in self.drones:
             if drone.id in self.initial_drone_states:
                 initial_state = self.initial_drone_states[drone.id]
-                drone.current_position = list(initial_state['position'])
-                drone.current_battery = initial_state['battery']
+                drone.current_position = list(initial_state.position)
+                drone.current_battery = initial_state.battery
                 drone.route = []
                 if hasattr(drone, 'status'):
-                    drone.status = initial_state['status']
+                    drone.status = initial_state.status
         
         # Delivery'leri sıfırla
         for delivery in self.deliveries:
             if delivery.id in self.initial_delivery_states:
                 initial_state = self.initial_delivery_states[delivery.id]
-                if hasattr(delivery, 'status'):
-                    delivery.status = initial_state['status']
-                if hasattr(delivery, 'assigned_drone'):
-                    delivery.assigned_drone = initial_state['assigned_drone']
+                delivery.status = initial_state.status
+                delivery.assigned_drone = initial_state.assigned_drone
         
         # Assignment'ları sıfırla
         self.assignment = {drone.id: [] for drone in self.drones}
@@ -185,24 +242,15 @@ class DeliveryOptimizer:
         self.assignment[drone.id] = []
         
         # Başlangıç durumunu kaydet
-        self.initial_drone_states[drone.id] = {
-            'position': tuple(drone.current_position),
-            'battery': drone.current_battery,
-            'route': [],
-            'status': getattr(drone, 'status', 'available')
-        }
+        self.initial_drone_states[drone.id] = _drone_state(drone)
         print(f"[ADD] Drone {drone.id} eklendi")
     
     def add_delivery(self, delivery: Delivery):
         """Yeni delivery ekle ve başlangıç durumunu kaydet"""
-        self.deliveries.append(delivery)
-        self.deliveries = sorted(self.deliveries)  # Priority'ye göre sırala
+        insort(self.deliveries, delivery, key=attrgetter('sort_key'))  # Priority'ye göre sıralı ekle
         
         # Başlangıç durumunu kaydet
-        self.initial_delivery_states[delivery.id] = {
-            'status': getattr(delivery, 'status', 'pending'),
-            'assigned_drone': getattr(delivery, 'assigned_drone', None)
-        }
+        self.initial_delivery_states[delivery.id] = _delivery_state(delivery)
         print(f"[ADD] Delivery {delivery.id} eklendi")
     
     def add_no_fly_zone(self, zone: NoFlyZone):
@@ -228,8 +276,10 @@ class DeliveryOptimizer:
     
     def solve_csp(self, timeout_seconds: float = 30.0) -> Dict[str, List[Delivery]]:
         """Improved CSP: Assign deliveries to drones in sequence, maximizing completed deliveries. Robust against infinite loops and excessive slowness."""
+        self._zones_key = _zones_key(self.no_fly_zones)  # zones may have changed since the last solve
         start_time = time.time()
-        deliveries = sorted(self.deliveries, key=lambda d: (-d.priority, d.time_window_start))
+        order = np.lexsort(([d._t0 for d in self.deliveries], [-d.priority for d in self.deliveries]))
+        deliveries = [self.deliveries[i] for i in order]
         drone_states = {drone.id: {
             'position': drone.current_position,
             'battery': drone.current_battery,
@@ -237,6 +287,14 @@ class DeliveryOptimizer:
             'route': list(drone.route)
         } for drone in self.drones}
         assignment = {drone.id: [] for drone in self.drones}
+        # Durumların dizi kopyaları: A* öncesi tüm drone'lar tek seferde elenir
+        positions = np.array([drone.current_position for drone in self.drones], dtype=np.float64)
+        batteries = np.array([drone.current_battery for drone in self.drones], dtype=np.float64)
+        times = np.full(len(self.drones), self._now)
+        max_weights = np.array([drone.max_weight for drone in self.drones], dtype=np.float64)
+        speeds = np.array([drone.speed for drone in self.drones], dtype=np.float64)
+        # A* rotası hedefin grid hücresinde biter; düz mesafeden en fazla bu kadar kısa olabilir
+        snap_slack = np.sqrt(2) * self.router.resolution
         for delivery in deliveries:
             if time.time() - start_time > timeout_seconds:
                 print(f"[CSP] Timeout reached ({timeout_seconds}s), returning partial solution")
@@ -244,11 +302,15 @@ class DeliveryOptimizer:
             best_drone = None
             best_arrival_time = None
             best_path = None
+            # Rota uzunluğunun alt sınırıyla ağırlık, batarya ve teslim süresi kontrolü
+            offsets = positions - delivery.position
+            lower = np.maximum(np.hypot(offsets[:, 0], offsets[:, 1]) - snap_slack, 0.0)
+            feasible = ((delivery.weight <= max_weights) & (lower <= batteries) &
+                        (times + lower / speeds * 3600.0 <= delivery._t1))
             # Path-finding ve uygunluk kontrollerini optimize et
-            for drone in self.drones:
+            for idx in np.flatnonzero(feasible):
+                drone = self.drones[idx]
                 state = drone_states[drone.id]
-                if delivery.weight > drone.max_weight:
-                    continue
                 # Path-finding'i try/except ile güvenli yap
                 try:
                     path = self.router.find_path(state['position'], delivery.position, drone, self.no_fly_zones, state['time'])
@@ -258,18 +320,9 @@ class DeliveryOptimizer:
                 if not path or len(path) < 2:
                     continue
                 # No-fly zone ve path intersect kontrolünü optimize et
-                path_blocked = False
-                for zone in self.no_fly_zones:
-                    if zone.is_active(state['time']):
-                        for i in range(len(path)-1):
-                            if zone.intersects_line(path[i], path[i+1]):
-                                path_blocked = True
-                                break
-                        if path_blocked:
-                            break
-                if path_blocked:
+                if _zone_index(self._zone_indexes, self._zones_key, self.no_fly_zones, state['time']).path_intersects(path):
                     continue
-                total_dist = sum(np.sqrt((path[i+1][0] - path[i][0])**2 + (path[i+1][1] - path[i][1])**2) for i in range(len(path)-1))
+                total_dist = route_length(path)
                 travel_time = total_dist / drone.speed
                 arrival_time = state['time'] + timedelta(hours=travel_time)
                 battery_used = total_dist
@@ -279,17 +332,20 @@ class DeliveryOptimizer:
                     continue
                 if best_arrival_time is None or arrival_time < best_arrival_time:
                     best_drone = drone
+                    best_idx = idx
                     best_arrival_time = arrival_time
                     best_path = path
+                    best_dist = total_dist
             if best_drone:
                 assignment[best_drone.id].append(delivery)
                 state = drone_states[best_drone.id]
-                total_dist = sum(np.sqrt((best_path[i+1][0] - best_path[i][0])**2 + (best_path[i+1][1] - best_path[i][1])**2) for i in range(len(best_path)-1))
-                travel_time = total_dist / best_drone.speed
                 state['position'] = delivery.position
-                state['battery'] -= total_dist
+                state['battery'] -= best_dist
                 state['time'] = best_arrival_time
                 state['route'].extend(best_path[1:])
+                positions[best_idx] = delivery.position
+                batteries[best_idx] = state['battery']
+                times[best_idx] = best_arrival_time.timestamp()
                 delivery.assigned_drone = best_drone.id
                 delivery.status = "completed"
             else:
@@ -307,23 +363,19 @@ class DeliveryOptimizer:
             return False
         
         # Check time window
-        if not delivery.is_within_time_window(self.current_time):
+        if not delivery.is_within_time_window(self._now):
             return False
         
         # Check if drone's current route intersects with any no-fly zones
-        for zone in self.no_fly_zones:
-            if zone.is_active(self.current_time):
-                if any(zone.intersects_line(p1, p2) 
-                      for p1, p2 in zip(drone.route[:-1], drone.route[1:])):
-                    return False
+        if _zone_index(self._zone_indexes, self._zones_key, self.no_fly_zones, self.current_time).path_intersects(drone.route_array()):
+            return False
         
         return True
     
     def _calculate_assignment_score(self, drone: Drone, delivery: Delivery) -> float:
         """Calculate score for a potential assignment."""
         # Distance to delivery point
-        distance = np.sqrt((drone.current_position[0] - delivery.position[0])**2 +
-                         (drone.current_position[1] - delivery.position[1])**2)
+        distance = euclid(*drone.current_position, *delivery.position)
         
         # Time until deadline
         time_until_deadline = delivery.time_until_deadline(self.current_time)
@@ -338,6 +390,7 @@ class DeliveryOptimizer:
     
     def _reschedule_deliveries(self, failed_delivery: Delivery) -> bool:
         """Try to reschedule existing deliveries to accommodate failed delivery."""
+        self._zones_key = _zones_key(self.no_fly_zones)
         for drone_id, deliveries in self.assignment.items():
             for i, delivery in enumerate(deliveries):
                 # Try to swap deliveries
@@ -349,16 +402,32 @@ class DeliveryOptimizer:
 class GeneticOptimizer:
     def __init__(self, drones: List[Drone], deliveries: List[Delivery],
                  no_fly_zones: List[NoFlyZone], current_time: datetime,
-                 population_size: int = 30, generations: int = 20, max_time: float = 20.0, early_stop_rounds: int = 5):
+                 population_size: int = 30, generations: int = 20, max_time: float = 20.0, early_stop_rounds: int = 5,
+                 drone_arrays: DroneArrays = None, delivery_arrays: DeliveryArrays = None,
+                 router: AStarRouter = None):
         if not drones or not deliveries:
             raise ValueError("GeneticOptimizer: Drone ve teslimat listeleri boş olamaz!")
         self.drones = drones
         self.deliveries = deliveries
+        # SoA kopyalar: mesafe matrisi bunlardan tek seferde hesaplanır
+        if drone_arrays is None or not drone_arrays.matches(drones):
+            drone_arrays = DroneArrays.from_drones(drones)
+        if delivery_arrays is None or not delivery_arrays.matches(deliveries):
+            delivery_arrays = DeliveryArrays.from_deliveries(deliveries)
+        self.drone_arrays = drone_arrays
+        self.delivery_arrays = delivery_arrays
+        self._drone_index = {drone.id: i for i, drone in enumerate(drones)}
+        self._dist = None
+        self._score = None
+        self._now = current_time.timestamp()
+        self.rng = np.random.default_rng()
         self.no_fly_zones = no_fly_zones
         self.current_time = current_time
         self.population_size = population_size
         self.generations = generations
-        self.router = AStarRouter((100, 100))
+        self.router = router if router is not None else AStarRouter((100, 100))
+        self._zone_indexes: Dict = {}
+        self._zones_key = _zones_key(no_fly_zones)
         self.max_time = max_time
         self.early_stop_rounds = early_stop_rounds
         
@@ -367,21 +436,9 @@ class GeneticOptimizer:
     
     def _store_initial_states(self):
         """Başlangıç durumlarını sakla - reset için kullanılacak"""
-        self.initial_drone_states = {}
-        for drone in self.drones:
-            self.initial_drone_states[drone.id] = {
-                'position': tuple(drone.current_position),
-                'battery': drone.current_battery,
-                'route': [],
-                'status': getattr(drone, 'status', 'available')
-            }
-        
-        self.initial_delivery_states = {}
-        for delivery in self.deliveries:
-            self.initial_delivery_states[delivery.id] = {
-                'status': getattr(delivery, 'status', 'pending'),
-                'assigned_drone': getattr(delivery, 'assigned_drone', None)
-            }
+        self.initial_drone_states: Dict[str, DroneState] = {drone.id: _drone_state(drone) for drone in self.drones}
+        self.initial_delivery_states: Dict[str, DeliveryState] = {
+            delivery.id: _delivery_state(delivery) for delivery in self.deliveries}
     
     def reset_all_data(self):
         """Tüm drone'ları, delivery'leri başlangıç durumuna sıfırla"""
@@ -391,62 +448,84 @@ class GeneticOptimizer:
         for drone in self.drones:
             if drone.id in self.initial_drone_states:
                 initial_state = self.initial_drone_states[drone.id]
-                drone.current_position = list(initial_state['position'])
-                drone.current_battery = initial_state['battery']
+                drone.current_position = list(initial_state.position)
+                drone.current_battery = initial_state.battery
                 drone.route = []
                 if hasattr(drone, 'status'):
-                    drone.status = initial_state['status']
+                    drone.status = initial_state.status
         
         # Delivery'leri sıfırla
         for delivery in self.deliveries:
             if delivery.id in self.initial_delivery_states:
                 initial_state = self.initial_delivery_states[delivery.id]
-                if hasattr(delivery, 'status'):
-                    delivery.status = initial_state['status']
-                if hasattr(delivery, 'assigned_drone'):
-                    delivery.assigned_drone = initial_state['assigned_drone']
+                delivery.status = initial_state.status
+                delivery.assigned_drone = initial_state.assigned_drone
         
         print(f"[GA-RESET] {len(self.drones)} drone, {len(self.deliveries)} delivery sıfırlandı")
         return True
     
+    def _update_distance_matrix(self):
+        """Recompute the drone -> delivery distance matrix from current drone positions."""
+        self.drone_arrays.refresh(self.drones)
+        self._dist = distance_matrix(self.drone_arrays.positions, self.delivery_arrays.positions)
+    
+    def _path_is_invalid(self, drone: Drone, delivery: Delivery) -> bool:
+        """True if no route exists or the route crosses an active no-fly zone."""
+        try:
+            path = self.router.find_path(drone.current_position, delivery.position, drone, self.no_fly_zones, self.current_time)
+        except Exception as e:
+            path = []
+        return not path or _zone_index(self._zone_indexes, self._zones_key, self.no_fly_zones, self.current_time).path_intersects(path)
+    
+    def _build_score_table(self, start_time: float = None, timeout_seconds: float = float('inf')):
+        """Precompute the per-(drone, delivery) fitness contribution.
+        
+        A gene's score only depends on which drone carries which delivery, so
+        every route is checked once per solve instead of once per individual.
+        Pairs not checked before the timeout count as invalid routes.
+        """
+        if self._dist is None:
+            self._update_distance_matrix()
+        if start_time is None:
+            start_time = time.time()
+        n_drones, n_deliveries = self._dist.shape
+        invalid = np.ones((n_drones, n_deliveries), dtype=bool)
+        for i, drone in enumerate(self.drones):
+            for j, delivery in enumerate(self.deliveries):
+                if time.time() - start_time > timeout_seconds:
+                    print(f"[GA] Timeout while checking routes, remaining pairs treated as invalid")
+                    break
+                invalid[i, j] = self._path_is_invalid(drone, delivery)
+            else:
+                continue
+            break
+        completed = np.fromiter((d.status == "completed" for d in self.deliveries), dtype=bool, count=n_deliveries)
+        score = np.where(completed, self.delivery_arrays.priorities * 10.0, 0.0)[None, :]
+        score = score - self._dist / self.drone_arrays.speeds[:, None] * 2.0
+        score = score - np.where(self.delivery_arrays.window_mask(self._now), 0.0, 20.0)[None, :]
+        self._score = np.where(invalid, -100.0, score)
+    
     def solve(self, timeout_seconds: float = 30.0) -> Dict[str, List[Delivery]]:
         """Solve delivery assignment using Genetic Algorithm with early stopping, time limit, and 30s timeout."""
+        self._zones_key = _zones_key(self.no_fly_zones)  # zones may have changed since the last solve
         start_time = time.time()
+        self._update_distance_matrix()
+        self._build_score_table(start_time, timeout_seconds)
         population = self._initialize_population()
         best_fitness = float('-inf')
         best_solution = None
         no_improve_rounds = 0
-        timeout_printed = False
-        
-        # Her 5 generasyonda bir timeout kontrolü yap
-        timeout_check_interval = 5
         
         for generation in range(self.generations):
-            # Her iterasyonda timeout kontrolü
-            current_time = time.time()
-            if current_time - start_time > timeout_seconds:
-                if not timeout_printed:
-                    print(f"[GA] Timeout reached ({timeout_seconds:.1f}s) at generation {generation}, returning best solution found")
-                    timeout_printed = True
-                break
-            # Fitness hesaplamasında da timeout kontrolü
-            fitness_start = time.time()
-            fitness_scores = []
-            for i, solution in enumerate(population):
-                if time.time() - start_time > timeout_seconds:
-                    print(f"[GA] Timeout during fitness calculation at generation {generation}, using partial results")
-                    # Kalan çözümler için düşük fitness değeri ata
-                    fitness_scores.extend([float('-inf')] * (len(population) - i))
-                    break
-                fitness_scores.append(self._calculate_fitness(solution))
-            
-            if not fitness_scores:  # Eğer hiç fitness hesaplanamadıysa
+            if time.time() - start_time > timeout_seconds:
+                print(f"[GA] Timeout reached ({timeout_seconds:.1f}s) at generation {generation}, returning best solution found")
                 break
-                
-            gen_best = max(fitness_scores) if fitness_scores else float('-inf')
-            if gen_best > best_fitness:
-                best_fitness = gen_best
-                best_solution = population[fitness_scores.index(gen_best)] if fitness_scores else None
+            # Tüm popülasyonun fitness'ı tek seferde
+            fitness_scores = self._calculate_fitness(population)
+            best_idx = int(np.argmax(fitness_scores))
+            if fitness_scores[best_idx] > best_fitness:
+                best_fitness = fitness_scores[best_idx]
+                best_solution = population[best_idx].copy()
                 no_improve_rounds = 0
             else:
                 no_improve_rounds += 1
@@ -456,56 +535,30 @@ class GeneticOptimizer:
                 print(f"[GA] Early stopping at generation {generation} (no improvement for {self.early_stop_rounds} rounds)")
                 break
             
-            # Timeout kontrolü - parent selection öncesi
-            if time.time() - start_time > timeout_seconds:
-                print(f"[GA] Timeout before parent selection at generation {generation}")
-                break
             parents = self._select_parents(population, fitness_scores)
-            new_population = []
-            
-            # Yeni popülasyon oluştururken timeout kontrolü
-            while len(new_population) < self.population_size:
-                if time.time() - start_time > timeout_seconds:
-                    print(f"[GA] Timeout during population generation at generation {generation}")
-                    # Mevcut popülasyonla devam et
-                    break
-                    
-                if random.random() < 0.2:  # 20% chance to inject random individual
-                    new_population.append(self._random_individual())
-                else:
-                    parent1, parent2 = random.sample(parents, 2)
-                    child = self._crossover(parent1, parent2)
-                    child = self._mutate(child)
-                    new_population.append(child)
-            
-            # Eğer yeni popülasyon tam oluşturulamadıysa, eskisini kullan
-            if len(new_population) < self.population_size:
-                population = new_population + population[:(self.population_size - len(new_population))]
-            else:
-                population = new_population
+            # Her çocuk için farklı iki ebeveyn
+            first = self.rng.integers(0, len(parents), self.population_size)
+            second = (first + self.rng.integers(1, max(len(parents), 2), self.population_size)) % len(parents)
+            children = self._mutate(self._crossover(parents[first], parents[second]))
+            # 20% chance to inject random individual
+            inject = self.rng.random(self.population_size) < 0.2
+            children[inject] = self._random_individual(int(inject.sum()))
+            population = children
         
         # En iyi çözümü döndür
         if best_solution is None:
-            if population:
-                try:
-                    best_solution = max(population, key=self._calculate_fitness)
-                except:
-                    # Fitness hesaplamasında hata varsa ilk çözümü kullan
-                    best_solution = population[0] if population else self._random_individual()
-            else:
-                best_solution = self._random_individual()
+            best_solution = population[int(np.argmax(self._calculate_fitness(population)))]
         
         print(f"[GA] Algorithm completed in {time.time() - start_time:.2f} seconds")
         assignment = self._convert_to_assignment(best_solution)
         
         # Son adımda da timeout kontrolü yaparak güvenli bir şekilde sonlandır
-        assignment_start = time.time()
         for drone_id, deliveries in assignment.items():
             if time.time() - start_time > timeout_seconds:
                 print(f"[GA] Timeout during final assignment processing")
                 break
                 
-            drone = next(d for d in self.drones if d.id == drone_id)
+            drone = self.drones[self._drone_index[drone_id]]
             for delivery in deliveries:
                 if time.time() - start_time > timeout_seconds:
                     print(f"[GA] Timeout during delivery processing")
@@ -518,131 +571,96 @@ class GeneticOptimizer:
                     path = []
                 if not path:
                     print(f"[GA] No path found for delivery {delivery.id} (drone {drone.id})")
-                elif any(
-                    zone.is_active(self.current_time) and any(
-                        zone.intersects_line(path[i], path[i+1])
-                        for i in range(len(path)-1)
-                    ) for zone in self.no_fly_zones):
+                elif _zone_index(self._zone_indexes, self._zones_key, self.no_fly_zones, self.current_time).path_intersects(path):
                     print(f"[GA] Path blocked by no-fly zone for delivery {delivery.id} (drone {drone.id})")
                     delivery.mark_failed()
                 else:
                     delivery.mark_completed()
         return assignment
 
-    def _initialize_population(self) -> List[List[Tuple[str, int]]]:
-        """Initialize population with random valid solutions."""
-        population = []
-        for _ in range(self.population_size):
-            solution = []
-            for delivery_idx in range(len(self.deliveries)):
-                drone_idx = random.randint(0, len(self.drones) - 1)
-                solution.append((self.drones[drone_idx].id, delivery_idx))
-            population.append(solution)
-        return population
-    
-    def _calculate_fitness(self, solution: List[Tuple[str, int]]) -> float:
-        """Calculate fitness of a solution with load balancing and overuse penalty. Robust against path-finding errors."""
-        assignment = self._convert_to_assignment(solution)
-        total_score = 0.0
-        used_drones = set()
-        delivery_counts = {drone.id: 0 for drone in self.drones}
-        for drone_id, deliveries in assignment.items():
-            drone = next(d for d in self.drones if d.id == drone_id)
-            if deliveries:
-                used_drones.add(drone_id)
-            delivery_counts[drone_id] = len(deliveries)
-            for delivery in deliveries:
-                try:
-                    path = self.router.find_path(drone.current_position, delivery.position, drone, self.no_fly_zones, self.current_time)
-                except Exception as e:
-                    path = []
-                if not path or any(
-                    zone.is_active(self.current_time) and any(
-                        zone.intersects_line(path[i], path[i+1])
-                        for i in range(len(path)-1)
-                    ) for zone in self.no_fly_zones):
-                    total_score -= 100.0  # Heavy penalty for invalid route
-                    continue
-                if delivery.status == "completed":
-                    total_score += delivery.priority * 10.0
-                distance = np.sqrt((drone.current_position[0] - delivery.position[0])**2 +
-                                 (drone.current_position[1] - delivery.position[1])**2)
-                energy_usage = distance / drone.speed
-                total_score -= energy_usage * 2.0
-                if not delivery.is_within_time_window(self.current_time):
-                    total_score -= 20.0
+    def _initialize_population(self) -> np.ndarray:
+        """Initialize population as a (population_size, n_deliveries) matrix of drone indices."""
+        return self._random_individual(self.population_size)
+    
+    def _calculate_fitness(self, population: np.ndarray) -> np.ndarray:
+        """Calculate fitness of every solution with load balancing and overuse penalty.
+        
+        Accepts a single solution row or a (P, N) population and returns one
+        score per row.
+        """
+        if self._score is None:
+            self._build_score_table()
+        population = np.atleast_2d(population)
+        n_drones, n_deliveries = self._score.shape
+        total_score = self._score[population, np.arange(n_deliveries)].sum(axis=1)
+        # Drone başına teslimat sayıları, (P, M)
+        offsets = population + (np.arange(len(population)) * n_drones)[:, None]
+        counts = np.bincount(offsets.ravel(), minlength=len(population) * n_drones).reshape(-1, n_drones)
+        used = counts > 0
+        n_used = used.sum(axis=1)
         # Penalty for unused drones
-        unused_drones = set(d.id for d in self.drones) - used_drones
-        total_score -= len(unused_drones) * 50.0
+        total_score -= (n_drones - n_used) * 50.0
         # Penalty for overused drones (quadratic penalty)
-        for count in delivery_counts.values():
-            if count > 0:
-                total_score -= (count - len(self.deliveries) / len(self.drones)) ** 2 * 5
+        total_score -= np.where(used, (counts - n_deliveries / n_drones) ** 2 * 5, 0.0).sum(axis=1)
         # Bonus for using more drones
-        total_score += len(used_drones) * 10.0
+        total_score += n_used * 10.0
         return total_score
     
-    def _select_parents(self, population: List[List[Tuple[str, int]]],
-                       fitness_scores: List[float]) -> List[List[Tuple[str, int]]]:
+    def _select_parents(self, population: np.ndarray, fitness_scores: np.ndarray) -> np.ndarray:
         """Select parents using tournament selection."""
-        parents = []
-        for _ in range(len(population)):
-            # Tournament selection
-            candidates = random.sample(list(zip(population, fitness_scores)), 3)
-            winner = max(candidates, key=lambda x: x[1])[0]
-            parents.append(winner)
-        return parents
-    
-    def _crossover(self, parent1: List[Tuple[str, int]],
-                  parent2: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-        """Perform crossover between two parents."""
-        point = random.randint(0, len(parent1) - 1)
-        child = parent1[:point] + parent2[point:]
-        return child
-    
-    def _mutate(self, solution: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-        """Apply mutation to a solution (higher mutation rate)."""
+        size = len(population)
+        candidates = self.rng.integers(0, size, (size, 3))
+        winners = candidates[np.arange(size), np.argmax(fitness_scores[candidates], axis=1)]
+        return population[winners]
+    
+    def _crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+        """Perform single-point crossover between rows of two parent matrices."""
+        points = self.rng.integers(0, parent1.shape[1], len(parent1))
+        return np.where(np.arange(parent1.shape[1]) < points[:, None], parent1, parent2)
+    
+    def _mutate(self, solutions: np.ndarray) -> np.ndarray:
+        """Apply mutation to solutions (higher mutation rate)."""
         mutation_rate = 0.3
-        for idx in range(len(solution)):
-            if random.random() < mutation_rate:
-                new_drone_idx = random.randint(0, len(self.drones) - 1)
-                solution[idx] = (self.drones[new_drone_idx].id, solution[idx][1])
-        return solution
+        mask = self.rng.random(solutions.shape) < mutation_rate
+        solutions[mask] = self.rng.integers(0, len(self.drones), int(mask.sum()))
+        return solutions
     
-    def _random_individual(self) -> List[Tuple[str, int]]:
-        """Create a random individual for diversity."""
-        return [(random.choice(self.drones).id, i) for i in range(len(self.deliveries))]
+    def _random_individual(self, count: int = 1) -> np.ndarray:
+        """Create random individuals for diversity."""
+        return self.rng.integers(0, len(self.drones), (count, len(self.deliveries)))
     
-    def _convert_to_assignment(self, solution: List[Tuple[str, int]]) -> Dict[str, List[Delivery]]:
+    def _convert_to_assignment(self, solution: np.ndarray) -> Dict[str, List[Delivery]]:
         """Convert solution to delivery assignment."""
         assignment = {drone.id: [] for drone in self.drones}
-        for drone_id, delivery_idx in solution:
-            assignment[drone_id].append(self.deliveries[delivery_idx])
+        for delivery_idx, drone_idx in enumerate(solution):
+            assignment[self.drones[drone_idx].id].append(self.deliveries[delivery_idx])
         return assignment
 
     def solve_greedy(self) -> Dict[str, List[Delivery]]:
         """Greedy fallback: assign each delivery to the nearest available drone. Robust against path-finding errors."""
+        self._zones_key = _zones_key(self.no_fly_zones)  # zones may have changed since the last solve
         assignment = {drone.id: [] for drone in self.drones}
-        for delivery in self.deliveries:
+        self._update_distance_matrix()
+        # Taşıma ve zaman penceresi kontrolleri tek seferde; drone'lar mesafeye göre sıralı
+        in_window = self.delivery_arrays.window_mask(self._now)
+        nearest_first = np.argsort(self._dist, axis=0, kind='stable')
+        for j, delivery in enumerate(self.deliveries):
             best_drone = None
-            best_dist = float('inf')
-            for drone in self.drones:
-                if drone.can_carry(delivery.weight) and delivery.is_within_time_window(self.current_time):
+            if in_window[j]:
+                # İlk geçerli rotaya sahip en yakın drone kazanır; uzaktakiler için A* çalışmaz
+                can_carry = self.drone_arrays.feasibility(delivery.weight)
+                for i in nearest_first[:, j]:
+                    if not can_carry[i]:
+                        continue
+                    drone = self.drones[i]
                     try:
                         path = self.router.find_path(drone.current_position, delivery.position, drone, self.no_fly_zones, self.current_time)
                     except Exception as e:
                         path = []
-                    if not path or any(
-                        zone.is_active(self.current_time) and any(
-                            zone.intersects_line(path[i], path[i+1])
-                            for i in range(len(path)-1)
-                        ) for zone in self.no_fly_zones):
+                    if not path or _zone_index(self._zone_indexes, self._zones_key, self.no_fly_zones, self.current_time).path_intersects(path):
                         continue
-                    dist = np.sqrt((drone.current_position[0] - delivery.position[0])**2 +
-                                 (drone.current_position[1] - delivery.position[1])**2)
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_drone = drone
+                    best_drone = drone
+                    break
             if best_drone:
                 assignment[best_drone.id].append(delivery)
                 delivery.mark_completed()
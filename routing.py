@@ -1,20 +1,34 @@
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict
+from functools import lru_cache
 import numpy as np
 from heapq import heappush, heappop
 from datetime import datetime
-from zone import NoFlyZone
-from drone import Drone
-from shapely.geometry import LineString, Polygon
+from zone import NoFlyZone, ZoneIndex
+from drone import Drone, euclid
+from shapely.geometry import LineString
+
+# Above this many active zones, move checks query an STRtree instead of
+# scanning every zone's bounding box
+_TREE_MIN_ZONES = 8
 
 class AStarRouter:
     def __init__(self, grid_size: Tuple[int, int], resolution: float = 1.0):
         self.grid_size = grid_size
         self.resolution = resolution
         self.grid = np.zeros(grid_size)
+        # Per set of active zones: proximity penalty per grid node, finished paths
+        # and whether a move between two neighbouring nodes is clear
+        self._zone_memo: Dict[Tuple, Tuple[Dict[int, float], Dict[Tuple, List], Dict[int, bool], ZoneIndex]] = {}
+        # Searches address cells by flat index x * height + y
+        width, height = grid_size
+        self._cells = [(x, y) for x in range(width) for y in range(height)]
+        # In-grid neighbours of each cell with their step costs, built on first visit;
+        # the extra slot stays empty for a start outside the grid
+        self._steps: List[Tuple[Tuple[int, float], ...]] = [None] * (len(self._cells) + 1)
     
     def _euclidean_distance(self, a: Tuple[float, float], b: Tuple[float, float]) -> float:
         """Calculate Euclidean distance between two points."""
-        return np.sqrt((a[0] - b[0])**2 + (a[1] - b[1])**2)
+        return euclid(a[0], a[1], b[0], b[1])
     
     def _get_neighbors(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Get valid neighboring positions."""
@@ -26,39 +40,90 @@ class AStarRouter:
                 neighbors.append((new_x, new_y))
         return neighbors
     
+    def _cell_index(self, node: Tuple[int, int]) -> int:
+        """Flat index of a grid cell, or len(self._cells) for a node outside the grid."""
+        x, y = node
+        width, height = self.grid_size
+        if 0 <= x < width and 0 <= y < height:
+            return x * height + y
+        return len(self._cells)
+    
+    def _neighbor_steps(self, node: Tuple[int, int]) -> Tuple[Tuple[int, float], ...]:
+        """(neighbor index, step cost) pairs for a node; built once per in-grid cell."""
+        index = self._cell_index(node)
+        steps = self._steps[index] if index < len(self._cells) else None
+        if steps is None:
+            steps = tuple((self._cell_index(neighbor), self._euclidean_distance(node, neighbor))
+                          for neighbor in self._get_neighbors(node))
+            if index < len(self._cells):
+                self._steps[index] = steps
+        return steps
+    
     def _is_valid_move(self, pos: Tuple[int, int], no_fly_zones: List[NoFlyZone], 
                       current_time: datetime, prev_pos: Tuple[int, int] = None) -> bool:
         """Check if a move is valid considering no-fly zones. Now checks for line crossing."""
+        active = [zone for zone in no_fly_zones if zone.is_active(current_time)]
+        return self._move_clear(pos, prev_pos, active)
+    
+    def _move_clear(self, pos: Tuple[int, int], prev_pos: Tuple[int, int],
+                    active_zones: List[NoFlyZone], zone_index: ZoneIndex = None) -> bool:
+        """_is_valid_move against zones already filtered down to the active ones."""
         real_pos = (pos[0] * self.resolution, pos[1] * self.resolution)
         if prev_pos is not None:
             prev_real_pos = (prev_pos[0] * self.resolution, prev_pos[1] * self.resolution)
-            move_line = LineString([prev_real_pos, real_pos])
-            for zone in no_fly_zones:
-                if zone.is_active(current_time):
-                    poly = Polygon(zone.polygon_coordinates)
-                    if move_line.intersects(poly):
+            if zone_index is not None:
+                return not zone_index.path_intersects((prev_real_pos, real_pos))
+            move_line = None
+            for zone in active_zones:
+                if zone.bbox_overlaps(prev_real_pos, real_pos):
+                    if move_line is None:
+                        move_line = LineString([prev_real_pos, real_pos])
+                    if zone.polygon.intersects(move_line):
                         return False
         else:
-            for zone in no_fly_zones:
-                if zone.is_active(current_time) and zone.contains_point(real_pos):
+            for zone in active_zones:
+                if zone.contains_point(real_pos):
                     return False
         return True
     
     def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int], 
                   no_fly_zones: List[NoFlyZone], current_time: datetime) -> float:
         """Calculate heuristic cost considering no-fly zones."""
-        base_cost = self._euclidean_distance(a, b)
-        penalty = 0.0
-        
-        # Add penalty for proximity to no-fly zones
-        real_pos = (a[0] * self.resolution, a[1] * self.resolution)
-        for zone in no_fly_zones:
-            if zone.is_active(current_time):
+        active = [zone for zone in no_fly_zones if zone.is_active(current_time)]
+        return self._euclidean_distance(a, b) + self._zone_penalty(a, active, self._memo_for(active)[0])
+    
+    def _memo_for(self, active_zones: List[NoFlyZone]) -> Tuple[Dict, Dict, Dict, ZoneIndex]:
+        """Per-node zone penalties, found paths, move checks and (for many zones) a zone
+        index, shared by every search with these active zones."""
+        # Keyed by vertex bytes: an edited zone gets a fresh memo, while an
+        # equal zone (e.g. an unpickled copy) reuses the existing one
+        key = tuple(zone.path.vertices.tobytes() for zone in active_zones)
+        memo = self._zone_memo.get(key)
+        if memo is None:
+            if len(self._zone_memo) >= 8:
+                self._zone_memo.clear()
+            zone_index = ZoneIndex(active_zones) if len(active_zones) > _TREE_MIN_ZONES else None
+            memo = self._zone_memo[key] = ({}, {}, {}, zone_index)
+        return memo
+    
+    def _zone_penalty(self, node: Tuple[int, int], active_zones: List[NoFlyZone],
+                      penalties: Dict[int, float]) -> float:
+        """Penalty for proximity to no-fly zones, computed once per grid cell."""
+        index = self._cell_index(node)
+        penalty = penalties.get(index)
+        if penalty is None:
+            penalty = 0.0
+            x, y = real_pos = (node[0] * self.resolution, node[1] * self.resolution)
+            for zone in active_zones:
+                minx, miny, maxx, maxy = zone.bbox
+                if x < minx - 5.0 or x > maxx + 5.0 or y < miny - 5.0 or y > maxy + 5.0:
+                    continue  # At least 5 from the bounding box, so no penalty
                 distance = zone.distance_to_boundary(real_pos)
                 if distance < 5.0:  # Penalty threshold
                     penalty += (5.0 - distance) * 2.0
-        
-        return base_cost + penalty
+            if index < len(self._cells):
+                penalties[index] = penalty
+        return penalty
     
     def find_path(self, start: Tuple[float, float], goal: Tuple[float, float],
                  drone: Drone, no_fly_zones: List[NoFlyZone], 
@@ -68,46 +133,89 @@ class AStarRouter:
         start_grid = (int(start[0] / self.resolution), int(start[1] / self.resolution))
         goal_grid = (int(goal[0] / self.resolution), int(goal[1] / self.resolution))
         
-        # Initialize data structures
-        open_set: List[Tuple[float, int, Tuple[int, int]]] = []
-        closed_set: Set[Tuple[int, int]] = set()
-        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        g_score: Dict[Tuple[int, int], float] = {start_grid: 0}
-        f_score: Dict[Tuple[int, int], float] = {start_grid: self._heuristic(start_grid, goal_grid, 
-                                                                            no_fly_zones, current_time)}
+        active = [zone for zone in no_fly_zones if zone.is_active(current_time)]
+        penalties, paths, moves, zone_index = self._memo_for(active)
+        # The search only depends on the exact start, the goal cell and the zones
+        path_key = (start[0], start[1], goal_grid)
+        path = paths.get(path_key)
+        if path is None:
+            if len(paths) >= 4096:
+                paths.clear()
+            path = paths[path_key] = self._search(start, start_grid, goal_grid, active, penalties, moves,
+                                                  zone_index)
+        return list(path)
+    
+    def _search(self, start: Tuple[float, float], start_grid: Tuple[int, int], goal_grid: Tuple[int, int],
+                active: List[NoFlyZone], penalties: Dict[int, float],
+                moves: Dict[int, bool], zone_index: ZoneIndex = None) -> List[Tuple[float, float]]:
+        """Run the A* search itself over the active zones; returns [] if the goal is unreachable.
+        
+        Nodes are flat cell indices. Per-search state is kept in dicts that
+        only hold the nodes actually reached, so a short search on a large
+        grid does not allocate grid-sized arrays. A start outside the grid
+        takes the spare index past the last cell and is never memoized.
+        """
+        cells = self._cells
+        spare = len(cells)
+        start_index = self._cell_index(start_grid)
+        goal_index = self._cell_index(goal_grid)
+        if goal_index == spare and goal_grid != start_grid:
+            goal_index = -1  # Outside the grid: only reachable as the start itself
+        gx, gy = goal_grid
+        resolution = self.resolution
+        
+        open_set: List[Tuple[float, int, int]] = []
+        closed = set()
+        came_from = {start_index: -1}
+        g_score = {start_index: 0}
+        inf = float('inf')
         
         # Add start node to open set
-        heappush(open_set, (f_score[start_grid], 0, start_grid))
+        heappush(open_set, (self._euclidean_distance(start_grid, goal_grid) +
+                            self._zone_penalty(start_grid, active, penalties), 0, start_index))
         counter = 1  # For tie-breaking in heap
         
         while open_set:
             current_f, _, current = heappop(open_set)
             
-            if current == goal_grid:
+            if current == goal_index:
                 # Reconstruct path
                 path = []
-                while current in came_from:
-                    real_pos = (current[0] * self.resolution, current[1] * self.resolution)
-                    path.append(real_pos)
+                while came_from[current] != -1:
+                    x, y = cells[current]
+                    path.append((x * resolution, y * resolution))
                     current = came_from[current]
                 path.append(start)
                 path.reverse()
                 return path
             
-            closed_set.add(current)
+            closed.add(current)
+            current_node = cells[current] if current != spare else start_grid
             
-            for neighbor in self._get_neighbors(current):
-                if neighbor in closed_set or not self._is_valid_move(neighbor, no_fly_zones, current_time, prev_pos=current):
+            for neighbor, step in self._steps[current] or self._neighbor_steps(current_node):
+                if neighbor in closed:
+                    continue
+                if current == spare:
+                    clear = self._move_clear(cells[neighbor], current_node, active, zone_index)
+                else:
+                    # A move is the same segment in either direction
+                    move = current * spare + neighbor if current < neighbor else neighbor * spare + current
+                    clear = moves.get(move)
+                    if clear is None:
+                        clear = moves[move] = self._move_clear(cells[neighbor], current_node, active, zone_index)
+                if not clear:
                     continue
                 
-                tentative_g = g_score[current] + self._euclidean_distance(current, neighbor)
+                tentative_g = g_score[current] + step
                 
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                if tentative_g < g_score.get(neighbor, inf):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + self._heuristic(neighbor, goal_grid, 
-                                                                    no_fly_zones, current_time)
-                    heappush(open_set, (f_score[neighbor], counter, neighbor))
+                    penalty = penalties.get(neighbor)
+                    if penalty is None:
+                        penalty = self._zone_penalty(cells[neighbor], active, penalties)
+                    x, y = cells[neighbor]
+                    heappush(open_set, (tentative_g + (euclid(x, y, gx, gy) + penalty), counter, neighbor))
                     counter += 1
         
         return []  # No path found
@@ -118,24 +226,21 @@ class AStarRouter:
         for zone in no_fly_zones:
             if zone.is_active(current_time):
                 min_coord, max_coord = zone.get_bounding_box()
-                min_x = int(min_coord[0] / self.resolution)
-                min_y = int(min_coord[1] / self.resolution)
-                max_x = int(max_coord[0] / self.resolution)
-                max_y = int(max_coord[1] / self.resolution)
+                min_x = max(int(min_coord[0] / self.resolution), 0)
+                min_y = max(int(min_coord[1] / self.resolution), 0)
+                max_x = min(int(max_coord[0] / self.resolution), self.grid_size[0] - 1)
+                max_y = min(int(max_coord[1] / self.resolution), self.grid_size[1] - 1)
+                if min_x > max_x or min_y > max_y:
+                    continue
                 
-                for x in range(min_x, max_x + 1):
-                    for y in range(min_y, max_y + 1):
-                        if 0 <= x < self.grid_size[0] and 0 <= y < self.grid_size[1]:
-                            real_pos = (x * self.resolution, y * self.resolution)
-                            if zone.contains_point(real_pos):
-                                self.grid[x, y] = 1 
+                # Test every cell in the zone's bounding box in one call
+                xs, ys = np.mgrid[min_x:max_x + 1, min_y:max_y + 1]
+                cells = np.column_stack([xs.ravel(), ys.ravel()])
+                inside = zone.contains_points(cells * self.resolution)
+                self.grid[cells[inside, 0], cells[inside, 1]] = 1
+
 
-    def on_optimization_finished(self, assignment):
-        try:
-            self.system.execute_deliveries(assignment)
-            self.update_visualization()
-        finally:
-            if self.optimizing_dialog:
-                self.optimizing_dialog.close()
-                self.optimizing_dialog = None
-            self.optimizer_thread = None 
\ No newline at end of file
+@lru_cache(maxsize=4)
+def shared_router(grid_size: Tuple[int, int], resolution: float = 1.0) -> AStarRouter:
+    """One router per grid, so its zone-penalty memo outlives a single optimizer run."""
+    return AStarRouter(grid_size, resolution)
@@ -0,0 +1,10 @@
+"""Start the desktop interface.
+
+The optimizer's worker processes are spawned, and a spawned process
+re-imports the launching script. Keeping the Qt import inside the guard
+means those workers only load main.py and the model modules.
+"""
+
+if __name__ == '__main__':
+    from gui import main
+    main()
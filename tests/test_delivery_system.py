@@ -1,11 +1,18 @@
 import unittest
+import os
+import tempfile
+import orjson
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
-from drone import Drone
-from delivery import Delivery
-from zone import NoFlyZone
+from drone import Drone, DroneArrays, distance_matrix
+from delivery import Delivery, STATUS_CODES
+from zone import NoFlyZone, ZoneIndex, ZoneSet
 from routing import AStarRouter
-from optimizer import DeliveryOptimizer, GeneticOptimizer
+from optimizer import Assignment, DeliveryOptimizer, GeneticOptimizer, _zone_index, _zones_key
 from main import DroneDeliverySystem
+from visualizer import DeliveryVisualizer
 
 class TestDroneDeliverySystem(unittest.TestCase):
     def setUp(self):
@@ -77,12 +84,66 @@ class TestDroneDeliverySystem(unittest.TestCase):
         current_time = datetime.now()
         self.assertTrue(delivery.is_within_time_window(current_time))
         self.assertFalse(delivery.is_within_time_window(current_time + timedelta(hours=2)))
+        self.assertTrue(delivery.is_within_time_window(current_time.timestamp()))
+        self.assertFalse(delivery.is_within_time_window((current_time + timedelta(hours=2)).timestamp()))
     
     def test_no_fly_zone_contains_point(self):
         """Test no-fly zone point containment."""
         zone = self.no_fly_zones[0]
         self.assertTrue(zone.contains_point((35.0, 35.0)))
         self.assertFalse(zone.contains_point((50.0, 50.0)))
+        mask = zone.contains_points([(35.0, 35.0), (50.0, 50.0), (30.0, 35.0)])
+        self.assertEqual(mask.tolist(), [True, False, False])
+    
+    def test_zone_index(self):
+        """Test path checks against the indexed active zones."""
+        index = ZoneIndex(self.no_fly_zones, datetime.now())
+        self.assertTrue(index.path_intersects([(0.0, 0.0), (20.0, 20.0), (50.0, 50.0)]))
+        self.assertFalse(index.path_intersects([(0.0, 0.0), (50.0, 0.0), (50.0, 50.0)]))
+        self.assertFalse(index.path_intersects([(35.0, 35.0)]))
+        later = ZoneIndex(self.no_fly_zones, datetime.now() + timedelta(days=1))
+        self.assertFalse(later.path_intersects([(0.0, 0.0), (50.0, 50.0)]))
+        # Replacing a zone with another keeps the count but must not reuse the index
+        cache, now, zones = {}, datetime.now(), list(self.no_fly_zones)
+        path = [(0.0, 0.0), (50.0, 50.0)]
+        self.assertTrue(_zone_index(cache, _zones_key(zones), zones, now).path_intersects(path))
+        zones[0] = NoFlyZone("zone2", [(60.0, 60.0), (70.0, 60.0), (70.0, 70.0)],
+                             now - timedelta(hours=1), now + timedelta(hours=1))
+        self.assertFalse(_zone_index(cache, _zones_key(zones), zones, now).path_intersects(path))
+    
+    def test_zone_set(self):
+        """Test batched point checks against the zone arrays."""
+        zones = ZoneSet(self.no_fly_zones)
+        points = [(35.0, 35.0), (30.0, 35.0), (50.0, 50.0)]
+        self.assertEqual(zones.any_contains(points).tolist(), [True, False, False])
+        later = datetime.now() + timedelta(days=1)
+        self.assertEqual(zones.any_contains(points, later).tolist(), [False, False, False])
+        self.assertEqual(len(zones.polygon_coords(zones.active_mask(later))), 0)
+    
+    def test_visualizer_save(self):
+        """Test saving the scenario plot in raster formats."""
+        visualizer = DeliveryVisualizer(self.system.grid_size)
+        visualizer.plot_scenario(self.drones, self.deliveries, self.no_fly_zones, datetime.now())
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ('scenario.png', 'scenario.jpg'):
+                path = os.path.join(tmp, name)
+                visualizer.save(path)
+                self.assertGreater(os.path.getsize(path), 0)
+        plt.close(visualizer.fig)
+    
+    def test_drone_arrays(self):
+        """Test SoA drone mirror growth and distance matrix."""
+        arrays = DroneArrays(capacity=1)
+        for drone in self.drones:
+            arrays.append(drone)
+        self.assertEqual(len(arrays), 2)
+        self.assertTrue(arrays.matches(self.drones))
+        self.assertEqual(arrays.positions.tolist(), [[0.0, 0.0], [100.0, 0.0]])
+        dist = distance_matrix(arrays.positions, [d.position for d in self.deliveries])
+        self.assertEqual(dist.shape, (2, 2))
+        self.assertAlmostEqual(dist[1, 1], 50.0)
+        self.assertEqual(arrays.feasibility(6.0).tolist(), [False, True])
+        self.assertEqual(arrays.feasibility(1.0, [2000.0, 10.0]).tolist(), [False, True])
     
     def test_optimization(self):
         """Test delivery optimization."""
@@ -98,6 +159,14 @@ class TestDroneDeliverySystem(unittest.TestCase):
         ga_assignment = ga_optimizer.solve()
         self.assertIsInstance(ga_assignment, dict)
     
+    def test_assignment_encoding(self):
+        """Test compact assignment round trip."""
+        mapping = {"drone1": [], "drone2": [self.deliveries[1], self.deliveries[0]]}
+        assignment = Assignment.from_mapping(mapping, self.drones, self.deliveries)
+        self.assertEqual(assignment.drone_idx.tolist(), [1, 1])
+        self.assertEqual(assignment.delivery_idx.tolist(), [1, 0])
+        self.assertEqual(assignment.to_mapping(self.drones, self.deliveries), mapping)
+    
     def test_system_execution(self):
         """Test complete system execution."""
         # Optimize deliveries
@@ -112,6 +181,50 @@ class TestDroneDeliverySystem(unittest.TestCase):
         self.assertIn('completed_deliveries', report)
         self.assertIn('failed_deliveries', report)
         self.assertIn('drone_statistics', report)
+        
+        # Snapshot arrays follow the executed state
+        snapshot = self.system.snapshot()
+        self.assertEqual(snapshot['delivery_status'].tolist(),
+                         [STATUS_CODES[d.status] for d in self.system.deliveries])
+        self.assertEqual(snapshot['drone_battery_pct'].tolist(),
+                         [d.get_remaining_battery_percentage() for d in self.system.drones])
+        for drone in self.system.drones:
+            self.assertEqual(drone.route_array().tolist(), [list(p) for p in drone.route])
+
+    def test_config_round_trip(self):
+        """Test saving and reloading a configuration file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.json')
+            self.system.save_config(path)
+            # Saving an untouched loaded config writes it back without building objects
+            copy_path = os.path.join(tmp, 'copy.json')
+            DroneDeliverySystem(path).save_config(copy_path)
+            loaded = DroneDeliverySystem(copy_path)
+        self.assertEqual([d.id for d in loaded.drones], [d.id for d in self.system.drones])
+        self.assertEqual([d.time_window_end for d in loaded.deliveries],
+                         [d.time_window_end for d in self.system.deliveries])
+        self.assertEqual(loaded.no_fly_zones[0].polygon_coordinates,
+                         [list(p) for p in self.no_fly_zones[0].polygon_coordinates])
+    
+    def test_config_invalid_zone(self):
+        """Test that a config with an invalid zone polygon fails at load time."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.json')
+            self.system.save_config(path)
+            bad_path = os.path.join(tmp, 'bad.json')
+            system = DroneDeliverySystem(path)
+            system.save_config(bad_path)
+            with open(bad_path, 'rb') as f:
+                config = orjson.loads(f.read())
+            # Self-intersecting "bow tie"
+            config['no_fly_zones'][0]['polygon_coordinates'] = [[0, 0], [10, 10], [10, 0], [0, 10]]
+            with open(bad_path, 'wb') as f:
+                f.write(orjson.dumps(config))
+            with self.assertRaises(ValueError):
+                system.load_config(bad_path)
+        # The earlier config is still fully usable
+        self.assertEqual(len(system.drones), 2)
+        self.assertEqual(len(system.no_fly_zones), 1)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
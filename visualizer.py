@@ -1,22 +1,58 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.text import Text
 from typing import List, Dict, Tuple
 import numpy as np
 from datetime import datetime
 from drone import Drone
-from delivery import Delivery
-from zone import NoFlyZone
+from delivery import Delivery, DeliveryStatus, STATUS_CODES, STATUS_COLOR_NAMES
+from zone import NoFlyZone, ZoneSet
 
 class DeliveryVisualizer:
-    def __init__(self, grid_size: Tuple[float, float]):
+    # Default drone palette, built once for all instances
+    _COLORS = plt.cm.rainbow(np.linspace(0, 1, 10))
+    
+    def __init__(self, grid_size: Tuple[float, float], max_priority_labels: int = 200,
+                 num_drones: int = None):
         self.grid_size = grid_size
         self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        self.colors = plt.cm.rainbow(np.linspace(0, 1, 10))  # For different drones
+        # For different drones; a larger fleet hint gets its own palette so colors don't repeat
+        if num_drones is not None and num_drones > len(self._COLORS):
+            self.colors = plt.cm.rainbow(np.linspace(0, 1, num_drones))
+        else:
+            self.colors = self._COLORS
+        # Above this many deliveries the P<n> labels are skipped
+        self.max_priority_labels = max_priority_labels
+        # Text artists reused from frame to frame instead of recreated
+        self._text_artists: List[Text] = []
+        self._texts_used = 0
+        # Zone arrays of the last plotted zone list
+        self._zone_set = None
+        self._zone_set_key = ()
+        # Comparison figure, created on first plot_optimization_comparison call
+        self._cmp_fig = None
+        self._cmp_ax = None
+    
+    def _text(self, x: float, y: float, label: str, **kwargs) -> Text:
+        """Place a label, reusing a Text artist from an earlier frame when possible."""
+        if self._texts_used < len(self._text_artists):
+            txt = self._text_artists[self._texts_used]
+            txt.set_position((x, y))
+            txt.set_text(label)
+            txt.update(kwargs)
+            self.ax.add_artist(txt)
+        else:
+            txt = self.ax.text(x, y, label, **kwargs)
+            self._text_artists.append(txt)
+        self._texts_used += 1
+        return txt
     
     def plot_scenario(self, drones: List[Drone], deliveries: List[Delivery],
                      no_fly_zones: List[NoFlyZone], current_time: datetime):
         """Plot the complete delivery scenario."""
         self.ax.clear()
+        self._texts_used = 0
         self.ax.set_xlim(0, self.grid_size[0])
         self.ax.set_ylim(0, self.grid_size[1])
         self.ax.set_title("Drone Delivery Fleet Visualization")
@@ -38,31 +74,42 @@ class DeliveryVisualizer:
         plt.tight_layout()
     
     def _plot_no_fly_zones(self, no_fly_zones: List[NoFlyZone], current_time: datetime):
-        """Plot active no-fly zones."""
-        for zone in no_fly_zones:
-            if zone.is_active(current_time):
-                polygon = patches.Polygon(zone.polygon_coordinates, 
-                                       facecolor='red', alpha=0.3,
-                                       label='No-Fly Zone')
-                self.ax.add_patch(polygon)
+        """Plot active no-fly zones as one patch collection."""
+        # Rebuilt only when the zone list changes (zones compare by content)
+        key = tuple(no_fly_zones)
+        if self._zone_set is None or key != self._zone_set_key:
+            self._zone_set, self._zone_set_key = ZoneSet(no_fly_zones), key
+        zone_set = self._zone_set
+        polygons = [patches.Polygon(coords)
+                    for coords in zone_set.polygon_coords(zone_set.active_mask(current_time))]
+        if polygons:
+            self.ax.add_collection(PatchCollection(polygons, facecolor='red', alpha=0.3,
+                                                   label='No-Fly Zone', rasterized=True))
     
     def _plot_delivery_points(self, deliveries: List[Delivery]):
-        """Plot delivery points with different markers based on status."""
-        for delivery in deliveries:
-            color = 'green' if delivery.status == "completed" else \
-                   'red' if delivery.status == "failed" else \
-                   'blue' if delivery.status == "in_progress" else 'gray'
-            
-            self.ax.scatter(delivery.position[0], delivery.position[1],
-                          c=color, marker='o', s=100,
-                          label=f'Delivery {delivery.id} ({delivery.status})')
-            
-            # Add priority label
-            self.ax.text(delivery.position[0], delivery.position[1] + 0.5,
-                        f'P{delivery.priority}', ha='center')
+        """Plot delivery points, one scatter (and legend entry) per status."""
+        if not deliveries:
+            return
+        positions = np.array([delivery.position for delivery in deliveries], dtype=np.float64)
+        codes = np.array([STATUS_CODES.get(delivery.status, DeliveryStatus.PENDING)
+                          for delivery in deliveries])
+        for status in DeliveryStatus:
+            mask = codes == status
+            if mask.any():
+                self.ax.scatter(positions[mask, 0], positions[mask, 1],
+                                c=STATUS_COLOR_NAMES[status], marker='o', s=100,
+                                label=f'Delivery ({status.name.lower()})')
+        
+        # Add priority labels
+        if len(deliveries) > self.max_priority_labels:
+            return
+        for (x, y), delivery in zip(positions.tolist(), deliveries):
+            self._text(x, y + 0.5, f'P{delivery.priority}', ha='center', fontsize='medium')
     
     def _plot_drones_and_routes(self, drones: List[Drone]):
         """Plot drones and their routes."""
+        segments = []
+        segment_colors = []
         for i, drone in enumerate(drones):
             color = self.colors[i % len(self.colors)]
             
@@ -71,41 +118,53 @@ class DeliveryVisualizer:
                           c=[color], marker='^', s=150,
                           label=f'Drone {drone.id}')
             
-            # Plot drone's route
-            if len(drone.route) > 1:
-                route_x = [p[0] for p in drone.route]
-                route_y = [p[1] for p in drone.route]
-                self.ax.plot(route_x, route_y, c=color, alpha=0.5, linestyle='--')
+            # Collect drone's route
+            route = drone.route_array()
+            if len(route) > 1:
+                segments.append(route)
+                segment_colors.append(color)
             
             # Add battery level
             battery_text = f'Battery: {drone.get_remaining_battery_percentage():.1f}%'
-            self.ax.text(drone.current_position[0], drone.current_position[1] - 0.5,
-                        battery_text, ha='center', fontsize=8)
+            self._text(drone.current_position[0], drone.current_position[1] - 0.5,
+                       battery_text, ha='center', fontsize=8)
+        
+        # All routes as one artist
+        if segments:
+            self.ax.add_collection(LineCollection(segments, colors=segment_colors,
+                                                  alpha=0.5, linestyles='--',
+                                                  rasterized=True))
     
     def show(self):
         """Display the plot."""
         plt.show()
     
     def save(self, filename: str):
-        """Save the plot to a file."""
-        plt.savefig(filename)
+        """Save the plot to a file.
+        
+        Saves this visualizer's figure rather than pyplot's current one.
+        Zones and routes are rasterized, so vector formats stay small.
+        """
+        self.fig.savefig(filename, dpi=100)
     
     def plot_statistics(self, drones: List[Drone], deliveries: List[Delivery]):
         """Plot delivery statistics."""
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
         
         # Plot delivery status distribution
-        status_counts = {'completed': 0, 'failed': 0, 'in_progress': 0, 'pending': 0}
-        for delivery in deliveries:
-            status_counts[delivery.status] += 1
-        
-        ax1.bar(status_counts.keys(), status_counts.values())
+        codes = np.fromiter((STATUS_CODES[delivery.status] for delivery in deliveries),
+                            dtype=np.int64, count=len(deliveries))
+        counts = np.bincount(codes, minlength=len(DeliveryStatus))
+        order = [DeliveryStatus.COMPLETED, DeliveryStatus.FAILED,
+                 DeliveryStatus.IN_PROGRESS, DeliveryStatus.PENDING]
+        ax1.bar([status.name.lower() for status in order], counts[order])
         ax1.set_title('Delivery Status Distribution')
         ax1.set_ylabel('Number of Deliveries')
         
         # Plot drone battery levels
         drone_ids = [drone.id for drone in drones]
-        battery_levels = [drone.get_remaining_battery_percentage() for drone in drones]
+        battery_levels = np.fromiter((drone.get_remaining_battery_percentage() for drone in drones),
+                                     dtype=np.float64, count=len(drones))
         
         ax2.bar(drone_ids, battery_levels)
         ax2.set_title('Drone Battery Levels')
@@ -118,15 +177,20 @@ class DeliveryVisualizer:
     def plot_optimization_comparison(self, csp_results: Dict, ga_results: Dict):
         """Plot comparison between CSP and GA optimization results."""
         metrics = ['completed_deliveries', 'total_distance', 'energy_usage']
-        csp_values = [csp_results[m] for m in metrics]
-        ga_values = [ga_results[m] for m in metrics]
+        values = np.array([[csp_results[m], ga_results[m]] for m in metrics], dtype=np.float64)
         
         x = np.arange(len(metrics))
         width = 0.35
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.bar(x - width/2, csp_values, width, label='CSP')
-        ax.bar(x + width/2, ga_values, width, label='GA')
+        # Reuse the comparison figure while its window is still open
+        if self._cmp_fig is None or not plt.fignum_exists(self._cmp_fig.number):
+            self._cmp_fig, self._cmp_ax = plt.subplots(figsize=(10, 6))
+        else:
+            self._cmp_ax.clear()
+            plt.figure(self._cmp_fig.number)
+        ax = self._cmp_ax
+        ax.bar(x - width/2, values[:, 0], width, label='CSP')
+        ax.bar(x + width/2, values[:, 1], width, label='GA')
         
         ax.set_ylabel('Value')
         ax.set_title('Optimization Algorithm Comparison')
@@ -134,5 +198,5 @@ class DeliveryVisualizer:
         ax.set_xticklabels(metrics)
         ax.legend()
         
-        plt.tight_layout()
-        plt.show() 
\ No newline at end of file
+        self._cmp_fig.tight_layout()
+        plt.show()
@@ -1,21 +1,40 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple
 from datetime import datetime
-from shapely.geometry import Polygon, Point
+import shapely
+from shapely.geometry import Polygon, Point, LineString
+from matplotlib.path import Path
 import numpy as np
 
-@dataclass
+@dataclass(slots=True)
 class NoFlyZone:
     id: str
     polygon_coordinates: List[Tuple[float, float]]
     active_time_start: datetime
     active_time_end: datetime
+    # Derived geometry, built in __post_init__
+    polygon: Polygon = field(init=False, repr=False, compare=False)
+    path: Path = field(init=False, repr=False, compare=False)
+    bbox: Tuple[float, float, float, float] = field(init=False, repr=False, compare=False)
+    # Built on first use, most zones never need them
+    _boundary: LineString = field(default=None, init=False, repr=False, compare=False)
+    _centroid: Tuple[float, float] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize the polygon and validate coordinates."""
         self.polygon = Polygon(self.polygon_coordinates)
         if not self.polygon.is_valid:
             raise ValueError("Invalid polygon coordinates")
+        # Prepared geometry: GEOS indexes the edges once for repeated predicates
+        shapely.prepare(self.polygon)
+        # Closed matplotlib path for batched point tests and drawing,
+        # wound counter-clockwise so a negative radius shrinks it
+        vertices = np.asarray(self.polygon_coordinates, dtype=np.float64)
+        x, y = vertices[:, 0], vertices[:, 1]
+        if np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) < 0:
+            vertices = vertices[::-1]
+        self.path = Path(np.vstack([vertices, vertices[:1]]), closed=True)
+        self.bbox = self.polygon.bounds  # (minx, miny, maxx, maxy)
     
     def is_active(self, current_time: datetime) -> bool:
         """Check if the no-fly zone is active at the given time."""
@@ -23,23 +42,44 @@ class NoFlyZone:
     
     def contains_point(self, point: Tuple[float, float]) -> bool:
         """Check if a point is inside the no-fly zone."""
-        return self.polygon.contains(Point(point))
+        minx, miny, maxx, maxy = self.bbox
+        if not (minx <= point[0] <= maxx and miny <= point[1] <= maxy):
+            return False  # Outside the bounding box, skip the GEOS call
+        return bool(shapely.contains_xy(self.polygon, point[0], point[1]))
+    
+    def contains_points(self, points) -> np.ndarray:
+        """Check an (N, 2) array of points at once; returns a boolean mask.
+        
+        Boundary points count as outside, matching contains_point.
+        """
+        return self.path.contains_points(np.asarray(points, dtype=np.float64).reshape(-1, 2),
+                                         radius=-1e-9)
+    
+    def bbox_overlaps(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
+        """Cheap reject test: does the segment's bounding box touch the zone's?"""
+        minx, miny, maxx, maxy = self.bbox
+        return not (max(start[0], end[0]) < minx or min(start[0], end[0]) > maxx or
+                    max(start[1], end[1]) < miny or min(start[1], end[1]) > maxy)
     
     def distance_to_boundary(self, point: Tuple[float, float]) -> float:
         """Calculate minimum distance from point to zone boundary."""
-        point_obj = Point(point)
-        return point_obj.distance(self.polygon.boundary)
+        if self._boundary is None:
+            self._boundary = self.polygon.boundary
+        return Point(point).distance(self._boundary)
     
     def intersects_line(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
         """Check if a line segment intersects with the no-fly zone."""
-        from shapely.geometry import LineString
+        if not self.bbox_overlaps(start, end):
+            return False
         line = LineString([start, end])
         return self.polygon.intersects(line)
     
     def get_centroid(self) -> Tuple[float, float]:
         """Get the centroid of the no-fly zone."""
-        centroid = self.polygon.centroid
-        return (centroid.x, centroid.y)
+        if self._centroid is None:
+            centroid = self.polygon.centroid
+            self._centroid = (centroid.x, centroid.y)
+        return self._centroid
     
     def to_dict(self) -> dict:
         """Convert no-fly zone to dictionary for serialization."""
@@ -60,5 +100,80 @@ class NoFlyZone:
     
     def get_bounding_box(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
         """Get the bounding box of the no-fly zone."""
-        minx, miny, maxx, maxy = self.polygon.bounds
-        return ((minx, miny), (maxx, maxy)) 
\ No newline at end of file
+        minx, miny, maxx, maxy = self.bbox
+        return ((minx, miny), (maxx, maxy))
+
+class ZoneIndex:
+    """STRtree over the no-fly zones active at one moment.
+    
+    A route is tested as a single polyline, and the tree only hands the
+    exact intersection test the zones whose bounds the route touches.
+    Same result as checking every segment against every active zone.
+    With no current_time, all given zones are indexed.
+    """
+    def __init__(self, no_fly_zones: List[NoFlyZone], current_time: datetime = None):
+        self.polygons = [zone.polygon for zone in no_fly_zones
+                         if current_time is None or zone.is_active(current_time)]
+        self._tree = shapely.STRtree(self.polygons) if self.polygons else None
+    
+    def path_intersects(self, path) -> bool:
+        """Check if any segment of a path crosses an indexed zone."""
+        if self._tree is None or len(path) < 2:
+            return False
+        return self._tree.query(LineString(path), predicate='intersects').size > 0
+
+class ZoneSet:
+    """Struct-of-arrays view of a list of no-fly zones.
+    
+    All vertices live in one (V, 2) array, zone i owning
+    coords[offsets[i]:offsets[i + 1]]; bounds and active windows are
+    stored as (N, 4) and (N,) arrays so whole-set queries run in NumPy.
+    """
+    def __init__(self, no_fly_zones: List[NoFlyZone]):
+        self.zones = list(no_fly_zones)
+        self.polygons = np.array([zone.polygon for zone in self.zones], dtype=object)
+        sizes = [len(zone.polygon_coordinates) for zone in self.zones]
+        self.offsets = np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+        self.coords = (np.concatenate([np.asarray(zone.polygon_coordinates, dtype=np.float64)
+                                       for zone in self.zones])
+                       if self.zones else np.empty((0, 2)))
+        self.bboxes = np.array([zone.bbox for zone in self.zones], dtype=np.float64).reshape(-1, 4)
+        self.starts = np.array([zone.active_time_start for zone in self.zones], dtype='datetime64[us]')
+        self.ends = np.array([zone.active_time_end for zone in self.zones], dtype='datetime64[us]')
+    
+    def __len__(self) -> int:
+        return len(self.zones)
+    
+    def active_mask(self, current_time: datetime) -> np.ndarray:
+        """Boolean mask of the zones active at current_time."""
+        now = np.datetime64(current_time, 'us')
+        return (self.starts <= now) & (now <= self.ends)
+    
+    def polygon_coords(self, mask: np.ndarray = None) -> List[np.ndarray]:
+        """Vertex arrays of the zones selected by mask (all zones by default)."""
+        indices = range(len(self)) if mask is None else np.flatnonzero(mask)
+        return [self.coords[self.offsets[i]:self.offsets[i + 1]] for i in indices]
+    
+    def any_contains(self, points, current_time: datetime = None) -> np.ndarray:
+        """For an (M, 2) array of points, is each inside any (active) zone?
+        
+        Points are first matched to zones by bounding box in one broadcast,
+        and only those candidates get the exact test. Boundary points count
+        as outside, matching NoFlyZone.contains_point.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result = np.zeros(len(points), dtype=bool)
+        if not len(self) or not len(points):
+            return result
+        bboxes = self.bboxes
+        x, y = points[:, 0, None], points[:, 1, None]
+        candidates = ((x >= bboxes[:, 0]) & (y >= bboxes[:, 1]) &
+                      (x <= bboxes[:, 2]) & (y <= bboxes[:, 3]))
+        if current_time is not None:
+            candidates &= self.active_mask(current_time)
+        point_idx, zone_idx = np.nonzero(candidates)
+        if point_idx.size:
+            inside = shapely.contains_xy(self.polygons[zone_idx],
+                                         points[point_idx, 0], points[point_idx, 1])
+            result[point_idx[inside]] = True
+        return result